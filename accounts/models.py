@@ -1,6 +1,8 @@
 import uuid
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils import timezone
 
 
@@ -61,6 +63,11 @@ class User(AbstractUser):
         indexes = [
             models.Index(fields=['email']),
             models.Index(fields=['is_active']),
+            # Trigram index matching Django's email__icontains SQL (UPPER(email::text) LIKE ...)
+            GinIndex(
+                OpClass(Upper(Cast('email', models.TextField())), name='gin_trgm_ops'),
+                name='user_email_trgm',
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,80 @@
+"""
+Buffer form view rows and insert them in batches off the request path.
+
+track_view hands each unsaved FormView to enqueue(). Rows are written with
+one bulk_create every FLUSH_INTERVAL seconds, or straight away once
+MAX_BATCH_SIZE rows are waiting. Rows still buffered when the process exits
+are lost; view counts are analytics, not records.
+"""
+import logging
+import threading
+
+from django.db import connections
+
+from analytics.models import FormView
+from forms.models import Form
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a view waits in the buffer before it is written
+FLUSH_INTERVAL = 0.2
+
+# Buffered views that force an immediate write
+MAX_BATCH_SIZE = 500
+
+_buffer = []
+_lock = threading.Lock()
+_timer = None
+
+
+def enqueue(view):
+    """Buffer an unsaved FormView for the next batch insert"""
+    global _timer
+    ready = None
+    with _lock:
+        _buffer.append(view)
+        if len(_buffer) >= MAX_BATCH_SIZE:
+            ready = _buffer[:]
+            _buffer.clear()
+        elif _timer is None:
+            _timer = threading.Timer(FLUSH_INTERVAL, _flush_from_timer)
+            _timer.daemon = True
+            _timer.start()
+    if ready:
+        _write(ready)
+
+
+def flush():
+    """Write every buffered view now"""
+    global _timer
+    with _lock:
+        views = _buffer[:]
+        _buffer.clear()
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+    if views:
+        _write(views)
+
+
+def _flush_from_timer():
+    try:
+        flush()
+    finally:
+        # The timer thread opened its own connection; don't leave it idle
+        connections.close_all()
+
+
+def _write(views):
+    try:
+        # Forms deleted while their views waited would fail the whole batch
+        live = set(Form.objects.filter(
+            id__in={view.form_id for view in views}
+        ).values_list('id', flat=True))
+        FormView.objects.bulk_create(
+            [view for view in views if view.form_id in live],
+            batch_size=MAX_BATCH_SIZE
+        )
+    except Exception as e:
+        logger.error(f"Error writing {len(views)} form views: {e}")
@@ -95,14 +95,26 @@ class AnalyticsConsumer(AsyncWebsocketConsumer):
             }))
 
     async def report_update(self, event):
-        """Handle report_update events from channel layer"""
+        """
+        Handle report_update events from channel layer
+
+        Submissions arriving close together come as one
+        {'status': 'batch', 'events': [...]} message (see submissions.realtime);
+        each event still reaches the client as its own report_update.
+        """
+        message = event.get('message', '')
+        if isinstance(message, dict) and message.get('status') == 'batch':
+            messages = message.get('events', [])
+        else:
+            messages = [message]
         try:
-            await self.send(text_data=json.dumps({
-                'type': 'report_update',
-                'data': event.get('data', {}),
-                'message': event.get('message', ''),
-                'timestamp': event.get('timestamp')
-            }))
+            for message in messages:
+                await self.send(text_data=json.dumps({
+                    'type': 'report_update',
+                    'data': event.get('data', {}),
+                    'message': message,
+                    'timestamp': event.get('timestamp')
+                }))
         except Exception as e:
             logger.error(f"Error sending report_update: {str(e)}")
 
@@ -2,6 +2,8 @@
 Tests for WebSocket Analytics Consumer and Real-time Reports
 """
 import json
+from unittest.mock import AsyncMock
+from asgiref.sync import async_to_sync
 from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
@@ -41,6 +43,33 @@ class AnalyticsConsumerTestCase(TestCase):
         self.assertTrue(hasattr(AnalyticsConsumer, 'view_update'))
         self.assertTrue(hasattr(AnalyticsConsumer, 'can_access_report'))
 
+    def test_report_update_unpacks_batches(self):
+        """Test a batched report update reaches the client as one frame per event"""
+        consumer = AnalyticsConsumer()
+        consumer.send = AsyncMock()
+        events = [
+            {'status': 'new_submission_received', 'submission_id': '1'},
+            {'status': 'new_submission_received', 'submission_id': '2'},
+        ]
+        async_to_sync(consumer.report_update)({
+            'type': 'report.update',
+            'message': {'status': 'batch', 'events': events}
+        })
+        
+        frames = [json.loads(call.kwargs['text_data']) for call in consumer.send.call_args_list]
+        self.assertEqual([frame['type'] for frame in frames], ['report_update', 'report_update'])
+        self.assertEqual([frame['message'] for frame in frames], events)
+
+    def test_report_update_single_message_unchanged(self):
+        """Test an unbatched report update is forwarded as before"""
+        consumer = AnalyticsConsumer()
+        consumer.send = AsyncMock()
+        message = {'status': 'new_submission_received', 'submission_id': '1'}
+        async_to_sync(consumer.report_update)({'type': 'report.update', 'message': message})
+        
+        consumer.send.assert_called_once()
+        self.assertEqual(json.loads(consumer.send.call_args.kwargs['text_data'])['message'], message)
+
 
 class RealTimeReportEndpointTestCase(TestCase):
     """Tests for real-time report REST endpoint"""
@@ -44,6 +44,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # OpClass index rendering (trigram search indexes)
 
     # Third-party apps
     'rest_framework',
@@ -21,6 +21,16 @@ if os.getenv('DB_HOST'):
         }
     }
 
+# Test database: TEST_MIGRATE=False builds the test schema straight from the
+# models instead of replaying every migration (use together with --keepdb)
+DATABASES['default'].setdefault('TEST', {})['MIGRATE'] = config('TEST_MIGRATE', default=True, cast=bool)
+
+# CACHE_TEST_DB=True keeps the migrated test database as a PostgreSQL
+# template and clones it on later runs until a migration file changes; the
+# runner also uses a fast password hasher, including in --parallel workers
+TEST_RUNNER = 'shared.test_runner.TestRunner'
+TEST_DB_CACHE = config('CACHE_TEST_DB', default=False, cast=bool)
+
 # Redis configuration for Docker
 if os.getenv('REDIS_URL'):
     redis_url = config('REDIS_URL', default='redis://localhost:6379/1')
@@ -49,23 +49,23 @@ class DashboardEndpointsTestCase(APITestCase):
         # Create form views
         FormView.objects.create(
             form=self.form1,
-            session_id='session-1'
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d'
         )
         FormView.objects.create(
             form=self.form2,
-            session_id='session-2'
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6'
         )
         
         # Create form submissions
         FormSubmission.objects.create(
             form=self.form1,
             status='submitted',
-            session_id='session-1'
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d'
         )
         FormSubmission.objects.create(
             form=self.form1,
             status='draft',
-            session_id='session-3'
+            session_id='9a99e817-ee56-52f5-9d8b-160c6fc417e4'
         )
 
     def test_dashboard_overview_authenticated(self):
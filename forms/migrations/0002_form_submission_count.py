@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-17 04:36
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_submission_count(apps, schema_editor):
+    """Seed the counter from the submissions that already exist"""
+    Form = apps.get_model('forms', 'Form')
+    FormSubmission = apps.get_model('submissions', 'FormSubmission')
+    counts = FormSubmission.objects.filter(
+        form=OuterRef('pk')
+    ).order_by().values('form').annotate(total=Count('*')).values('total')
+    Form.objects.update(submission_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0001_initial'),
+        ('submissions', '0008_formsubmission_sub_session_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='form',
+            name='submission_count',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_submission_count, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,8 @@ import uuid
 from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.contrib.auth.hashers import identify_hasher
+from django.utils.functional import cached_property
 
 
 class Form(models.Model):
@@ -36,6 +38,8 @@ class Form(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True)
+    # Maintained by submissions.signals so unfiltered totals skip COUNT(*)
+    submission_count = models.BigIntegerField(default=0, editable=False)
 
     class Meta:
         db_table = 'form'
@@ -50,6 +54,30 @@ class Form(models.Model):
     def __str__(self):
         return f"{self.title} ({self.unique_slug})"
 
+    def save(self, *args, **kwargs):
+        """
+        Save the form without writing back submission_count
+
+        Instances are often loaded before submissions arrive or leave, so
+        saving their stale counter would undo the F() updates. The counter
+        is only written on insert or when update_fields names it.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None \
+                and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname != 'submission_count'
+            ]
+        super().save(*args, **kwargs)
+
+    @cached_property
+    def password_hasher(self):
+        """Hasher that produced access_password, or None if it has no usable hash"""
+        try:
+            return identify_hasher(self.access_password)
+        except ValueError:
+            return None
+
 
 class FormField(models.Model):
     """
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import FormField, FieldOption, Form
+from .services import invalidate_active_form, invalidate_public_form
 from django.db import transaction
 import re
 from django.utils.text import slugify
@@ -361,6 +362,7 @@ class FormFieldReorderSerializer(serializers.Serializer):
                 id=item['id'],
                 form=form
             ).update(order_index=int(item['order_index']))
+        invalidate_public_form(form.id)
 
         return FormField.objects.filter(form=form).order_by('order_index')
 
@@ -426,6 +428,7 @@ class FieldOptionReorderSerializer(serializers.Serializer):
                 id=item['id'],
                 field=field
             ).update(order_index=int(item['order_index']))
+        invalidate_public_form(field.form_id)
 
         return FieldOption.objects.filter(field=field).order_by('order_index')
     
@@ -556,6 +559,11 @@ class FormSerializer(serializers.ModelSerializer):
             instance.access_password = make_password(access_password)
         elif 'visibility' in validated_data and validated_data['visibility'] == 'public':
             instance.access_password = None
+
+        # post_save only sees the new slug, so drop the lookup cached
+        # under the old one here
+        if validated_data.get('unique_slug', instance.unique_slug) != instance.unique_slug:
+            invalidate_active_form(instance.unique_slug)
             
         return super().update(instance, validated_data)
     
@@ -0,0 +1,64 @@
+"""
+Caches backing the public form endpoints served to respondents.
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.http import Http404
+
+from forms.models import Form
+
+
+# Seconds a cached public form payload is kept
+PUBLIC_FORM_CACHE_TIMEOUT = 300
+
+# Seconds an active form looked up by slug is kept
+ACTIVE_FORM_CACHE_TIMEOUT = 60
+
+# Columns the public actions read from the form itself
+ACTIVE_FORM_COLUMNS = ('id', 'unique_slug', 'visibility', 'access_password', 'is_active')
+
+
+def public_form_cache_key(form_id):
+    # Entries hold (payload, etag) pairs
+    return f'form_public:v2:{form_id}'
+
+
+def active_form_cache_key(slug):
+    return f'form_active:{slug}'
+
+
+def _delete_now_and_on_commit(key):
+    # Cleared again once the surrounding transaction commits, so a read
+    # racing the edit cannot keep the old value
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def invalidate_public_form(form_id):
+    """Drop the cached public payload of a form"""
+    _delete_now_and_on_commit(public_form_cache_key(form_id))
+
+
+def invalidate_active_form(slug):
+    """Drop the cached slug lookup of a form"""
+    _delete_now_and_on_commit(active_form_cache_key(slug))
+
+
+def get_active_form(slug):
+    """
+    Active form with the given slug, loaded with ACTIVE_FORM_COLUMNS only
+
+    Hot slugs are served from the cache; saving or deleting the form
+    drops the entry (see forms.signals). Raises Http404 when no active
+    form has the slug.
+    """
+    key = active_form_cache_key(slug)
+    form = cache.get(key)
+    if form is None:
+        form = Form.objects.only(*ACTIVE_FORM_COLUMNS).filter(
+            unique_slug=slug, is_active=True
+        ).first()
+        if form is None:
+            raise Http404('No active form matches the given slug.')
+        cache.set(key, form, timeout=ACTIVE_FORM_CACHE_TIMEOUT)
+    return form
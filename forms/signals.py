@@ -0,0 +1,36 @@
+"""
+Invalidate the cached public form payload and slug lookup when a form changes.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from forms.models import Form, FormField, FieldOption
+from forms.services import invalidate_active_form, invalidate_public_form
+
+
+@receiver([post_save, post_delete], sender=Form)
+def form_changed(sender, instance, **kwargs):
+    invalidate_public_form(instance.pk)
+    invalidate_active_form(instance.unique_slug)
+
+
+@receiver([post_save, post_delete], sender=FormField)
+def field_changed(sender, instance, origin=None, **kwargs):
+    # Deleting the form cascades here; the form's own signal covers it
+    if isinstance(origin, Form):
+        return
+    invalidate_public_form(instance.form_id)
+
+
+@receiver([post_save, post_delete], sender=FieldOption)
+def option_changed(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, (Form, FormField)):
+        return
+    if FieldOption.field.is_cached(instance):
+        form_id = instance.field.form_id
+    else:
+        form_id = FormField.objects.filter(
+            pk=instance.field_id
+        ).values_list('form_id', flat=True).first()
+    if form_id is not None:
+        invalidate_public_form(form_id)
@@ -129,6 +129,18 @@ class FormModelTest(TestCase):
         self.assertIn(['visibility', 'is_active'], indexes)
         self.assertIn(['created_at'], indexes)
 
+    def test_form_save_keeps_submission_count(self):
+        """Test saving a stale instance does not overwrite the counter"""
+        form = Form.objects.create(**self.form_data)
+        Form.objects.filter(pk=form.pk).update(submission_count=1)
+
+        form.title = 'Renamed'
+        form.save()
+
+        form.refresh_from_db()
+        self.assertEqual(form.title, 'Renamed')
+        self.assertEqual(form.submission_count, 1)
+
     def test_form_related_names(self):
         """Test related names for foreign key relationships"""
         form = Form.objects.create(**self.form_data)
@@ -20,6 +20,7 @@ from .serializers import (
 )
 from .models import Form, FormField, FieldOption
 from .permissions import IsFormOwner, CanManageFieldOptions
+from .services import invalidate_public_form
 from django.db import transaction
 from django.utils.text import slugify
 from django.utils import timezone
@@ -201,6 +202,7 @@ class FormFieldViewSet(viewsets.ModelViewSet):
             form=form,
             order_index__gt=order_index
         ).update(order_index=models.F('order_index') - 1)
+        invalidate_public_form(form.id)
 
         return Response(
             {'message': 'Field deleted successfully'},
@@ -413,6 +415,7 @@ class FieldOptionViewSet(viewsets.ModelViewSet):
             field=field,
             order_index__gt=order_index
         ).update(order_index=models.F('order_index') - 1)
+        invalidate_public_form(field.form_id)
 
         return Response(
             {'message': 'Option deleted successfully'},
@@ -612,6 +615,9 @@ class FormViewSet(viewsets.ModelViewSet):
         new_form = original_form
         new_form.pk = None
         new_form.id = uuid.uuid4()
+        # Insert rather than update, and start the copy with no submissions
+        new_form._state.adding = True
+        new_form.submission_count = 0
         new_form.title = f"Copy of {original_form.title}"
         
         new_slug = slugify(new_form.title)
@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 from processes.views import ProcessViewSet, ProcessStepViewSet
 from processes.public_views import PublicProcessViewSet
 from processes.analytics_views import ProcessAnalyticsViewSet
+import shared.converters  # noqa: F401 - registers <session_id:...>
 
 app_name = 'processes'
 
@@ -45,7 +46,7 @@ urlpatterns = [
     ),
     
     path(
-        'public/processes/<slug:slug>/progress/<str:session_id>/',
+        'public/processes/<slug:slug>/progress/<session_id:session_id>/',
         PublicProcessViewSet.as_view({
             'get': 'get_progress'
         }),
@@ -53,7 +54,7 @@ urlpatterns = [
     ),
     
     path(
-        'public/processes/<slug:slug>/progress/<str:session_id>/current-step/',
+        'public/processes/<slug:slug>/progress/<session_id:session_id>/current-step/',
         PublicProcessViewSet.as_view({
             'get': 'get_current_step'
         }),
@@ -61,7 +62,7 @@ urlpatterns = [
     ),
     
     path(
-        'public/processes/<slug:slug>/progress/<str:session_id>/next/',
+        'public/processes/<slug:slug>/progress/<session_id:session_id>/next/',
         PublicProcessViewSet.as_view({
             'post': 'move_next'
         }),
@@ -69,7 +70,7 @@ urlpatterns = [
     ),
     
     path(
-        'public/processes/<slug:slug>/progress/<str:session_id>/previous/',
+        'public/processes/<slug:slug>/progress/<session_id:session_id>/previous/',
         PublicProcessViewSet.as_view({
             'post': 'move_previous'
         }),
@@ -1,3 +1,4 @@
+import uuid
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -13,6 +14,8 @@ from processes.serializers import (
     ProcessCompleteSerializer,
 )
 from shared.exceptions import NotFoundError, ValidationError as CustomValidationError
+from shared.converters import SessionIdConverter
+from shared.utils import legacy_session_uuid, session_uuid
 
 
 @extend_schema_view(
@@ -152,7 +155,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         request=ProcessStartSerializer,
         responses={201: {'type': 'object', 'properties': {
             'progress_id': {'type': 'string', 'format': 'uuid'},
-            'session_id': {'type': 'string'},
+            'session_id': {'type': 'string', 'format': 'uuid'},
             'status': {'type': 'string'},
             'current_step_index': {'type': 'integer'},
             'completion_percentage': {'type': 'number'},
@@ -168,14 +171,14 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         Body: {"session_id": "optional-session-id"}
         """
         try:
-            session_id = request.data.get('session_id') or self._get_session_id(request)
+            session_id = self._resolve_session_id(request)
             user = request.user if request.user.is_authenticated else None
             
             progress = self.execution_service.start_process(slug, session_id, user)
             
             return Response({
                 'progress_id': str(progress.id),
-                'session_id': progress.session_id,
+                'session_id': str(progress.session_id),
                 'status': progress.status,
                 'current_step_index': progress.current_step_index,
                 'completion_percentage': float(progress.completion_percentage),
@@ -192,7 +195,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         description='Get progress status for a user session.',
         responses={200: {'type': 'object', 'description': 'Progress data'}}
     )
-    @action(detail=True, methods=['get'], url_path='progress/(?P<session_id>[^/.]+)')
+    @action(detail=True, methods=['get'], url_path=f'progress/(?P<session_id>{SessionIdConverter.regex})')
     def get_progress(self, request, slug=None, session_id=None):
         """
         Get user progress
@@ -210,7 +213,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         description='Get the current step for a user session.',
         responses={200: {'type': 'object', 'description': 'Current step data'}}
     )
-    @action(detail=True, methods=['get'], url_path='progress/(?P<session_id>[^/.]+)/current-step')
+    @action(detail=True, methods=['get'], url_path=f'progress/(?P<session_id>{SessionIdConverter.regex})/current-step')
     def get_current_step(self, request, slug=None, session_id=None):
         """
         Get current step
@@ -228,7 +231,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         description='Move to the next step in a linear process.',
         responses={200: {'type': 'object', 'description': 'Updated progress data'}}
     )
-    @action(detail=True, methods=['post'], url_path='progress/(?P<session_id>[^/.]+)/next')
+    @action(detail=True, methods=['post'], url_path=f'progress/(?P<session_id>{SessionIdConverter.regex})/next')
     def move_next(self, request, slug=None, session_id=None):
         """
         Move to next step (linear processes only)
@@ -248,7 +251,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         description='Go back to the previous step in a linear process.',
         responses={200: {'type': 'object', 'description': 'Updated progress data'}}
     )
-    @action(detail=True, methods=['post'], url_path='progress/(?P<session_id>[^/.]+)/previous')
+    @action(detail=True, methods=['post'], url_path=f'progress/(?P<session_id>{SessionIdConverter.regex})/previous')
     def move_previous(self, request, slug=None, session_id=None):
         """
         Go to previous step (linear processes only)
@@ -296,7 +299,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
         Body: {"submission_id": "optional-uuid", "session_id": "optional"}
         """
         try:
-            session_id = request.data.get('session_id') or self._get_session_id(request)
+            session_id = self._resolve_session_id(request)
             submission_id = request.data.get('submission_id')
             
             result = self.execution_service.complete_step(
@@ -331,8 +334,7 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
             if session_id is None or session_id == '':
                 raise DRFValidationError("session_id is required")
             
-            if not session_id:
-                session_id = self._get_session_id(request)
+            session_id = self._parse_session_id(session_id)
             
             result = self.execution_service.complete_process(slug, session_id)
             return Response(result, status=status.HTTP_200_OK)
@@ -342,10 +344,32 @@ class PublicProcessViewSet(viewsets.GenericViewSet):
             raise DRFValidationError(str(e))
 
     def _get_session_id(self, request):
-        """Get or generate session ID"""
-        if not request.session.session_key:
-            request.session.create()
-        return request.session.session_key
+        """
+        Get or generate session ID
+
+        Progress stored before session ids became UUIDs was keyed by the
+        Django session key and migrated to legacy_session_uuid(key), so an
+        existing session keeps resolving to that id.
+        """
+        session_id = request.session.get('process_session_id')
+        if not session_id:
+            if request.session.session_key:
+                session_id = str(legacy_session_uuid(request.session.session_key))
+            else:
+                session_id = str(uuid.uuid4())
+            request.session['process_session_id'] = session_id
+        return session_id
+
+    def _resolve_session_id(self, request):
+        """Use the client supplied session ID or fall back to the session one"""
+        session_id = request.data.get('session_id')
+        if not session_id:
+            return self._get_session_id(request)
+        return self._parse_session_id(session_id)
+
+    def _parse_session_id(self, value):
+        """Canonical UUID text for a client session ID, mapping legacy ids"""
+        return str(session_uuid(value))
 
     def _get_client_ip(self, request):
         """Get client IP address"""
@@ -471,7 +471,7 @@ class ProcessExecutionService:
         if submission_id:
             try:
                 submission = FormSubmission.objects.get(id=submission_id)
-                if submission.session_id != session_id:
+                if str(submission.session_id) != str(session_id):
                     raise CustomValidationError("Submission does not belong to this session")
             except FormSubmission.DoesNotExist:
                 raise NotFoundError(f"Submission with id '{submission_id}' not found")
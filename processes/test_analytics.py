@@ -111,12 +111,12 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting analytics overview"""
         ProcessView.objects.create(
             process=self.process,
-            session_id='session-1'
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d'
         )
         
         progress = self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
@@ -147,13 +147,13 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting views over time"""
         ProcessView.objects.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             viewed_at=timezone.now()
         )
         
         ProcessView.objects.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             viewed_at=timezone.now() - timedelta(days=5)
         )
         
@@ -175,7 +175,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting completions over time"""
         progress1 = self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         progress1.completed_at = timezone.now()
@@ -183,7 +183,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         
         progress2 = self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='completed'
         )
         progress2.completed_at = timezone.now() - timedelta(days=3)
@@ -200,19 +200,19 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting completion rate"""
         self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
         self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='in_progress'
         )
         
         self.progress_repo.create(
             process=self.process,
-            session_id='session-3',
+            session_id='9a99e817-ee56-52f5-9d8b-160c6fc417e4',
             status='abandoned'
         )
         
@@ -229,13 +229,13 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting step drop-off analysis"""
         progress1 = self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
         progress2 = self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='in_progress'
         )
         
@@ -257,7 +257,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting average completion time"""
         progress1 = self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         progress1.started_at = timezone.now() - timedelta(minutes=30)
@@ -266,7 +266,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         
         progress2 = self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='completed'
         )
         progress2.started_at = timezone.now() - timedelta(minutes=60)
@@ -294,13 +294,13 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test listing all progress records"""
         self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
         self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='in_progress'
         )
         
@@ -314,13 +314,13 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test filtering progress by status"""
         self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
         self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='in_progress'
         )
         
@@ -342,7 +342,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting specific progress details"""
         progress = self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
@@ -367,7 +367,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test getting progress from different process"""
         other_progress = self.progress_repo.create(
             process=self.other_process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='completed'
         )
         
@@ -380,7 +380,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         """Test listing abandoned progress"""
         abandoned1 = self.progress_repo.create(
             process=self.process,
-            session_id='session-1',
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='abandoned'
         )
         abandoned1.last_activity_at = timezone.now() - timedelta(hours=10)
@@ -388,7 +388,7 @@ class ProcessAnalyticsAPITestCase(APITestCase):
         
         abandoned2 = self.progress_repo.create(
             process=self.process,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='abandoned'
         )
         abandoned2.last_activity_at = timezone.now() - timedelta(hours=5)
@@ -109,7 +109,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
             is_required=False
         )
         
-        self.session_id = 'test-session-123'
+        self.session_id = '0b90c2be-4510-5921-9805-5df5697c4dd9'
         
     def test_get_public_process_success(self):
         """Test getting public process structure"""
@@ -238,7 +238,46 @@ class PublicProcessExecutionAPITestCase(APITestCase):
         
         progress = ProcessProgress.objects.get(id=response.data['progress_id'])
         self.assertEqual(progress.process, self.public_process)
-        self.assertEqual(progress.session_id, self.session_id)
+        self.assertEqual(str(progress.session_id), self.session_id)
+        
+    def test_start_process_resumes_migrated_session_progress(self):
+        """Test a session from before UUID session ids finds its migrated progress"""
+        from importlib import import_module
+        from shared.utils import LEGACY_SESSION_NAMESPACE, legacy_session_uuid
+        
+        migration = import_module('submissions.migrations.0002_alter_formsubmission_session_id_and_more')
+        self.assertEqual(LEGACY_SESSION_NAMESPACE, migration.LEGACY_SESSION_NAMESPACE)
+        
+        session = self.client.session
+        session.save()
+        legacy = ProcessProgress.objects.create(
+            process=self.public_process,
+            session_id=legacy_session_uuid(session.session_key),
+            status='in_progress'
+        )
+        
+        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/start/'
+        response = self.client.post(url, {}, format='json')
+        
+        self.assertEqual(response.data['progress_id'], str(legacy.id))
+        
+    def test_legacy_session_id_finds_migrated_progress(self):
+        """Test a pre-UUID session id a client still holds maps to its migrated progress"""
+        from shared.utils import legacy_session_uuid
+        
+        progress = ProcessProgress.objects.create(
+            process=self.public_process,
+            session_id=legacy_session_uuid('legacy-client-session'),
+            status='in_progress'
+        )
+        base = f'/api/v1/public/processes/{self.public_process.unique_slug}'
+        
+        response = self.client.post(f'{base}/start/', {'session_id': 'legacy-client-session'}, format='json')
+        self.assertEqual(response.data['progress_id'], str(progress.id))
+        
+        response = self.client.get(f'{base}/progress/legacy-client-session/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'in_progress')
         
     def test_start_process_existing_progress(self):
         """Test starting process with existing progress"""
@@ -305,7 +344,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
         
     def test_get_progress_not_found(self):
         """Test getting progress for non-existent session"""
-        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/non-existent-session/'
+        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/1f44d04a-edf1-53b2-ab14-f51f3c335d50/'
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -361,7 +400,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
         
     def test_get_current_step_not_found(self):
         """Test getting current step for non-existent progress"""
-        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/non-existent-session/current-step/'
+        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/1f44d04a-edf1-53b2-ab14-f51f3c335d50/current-step/'
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -418,7 +457,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
         
     def test_move_next_step_not_found(self):
         """Test moving next for non-existent progress"""
-        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/non-existent-session/next/'
+        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/1f44d04a-edf1-53b2-ab14-f51f3c335d50/next/'
         response = self.client.post(url, {}, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -475,7 +514,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
         
     def test_move_previous_step_not_found(self):
         """Test moving previous for non-existent progress"""
-        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/non-existent-session/previous/'
+        url = f'/api/v1/public/processes/{self.public_process.unique_slug}/progress/1f44d04a-edf1-53b2-ab14-f51f3c335d50/previous/'
         response = self.client.post(url, {}, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -596,7 +635,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
         
         submission = FormSubmission.objects.create(
             form=self.form1,
-            session_id='different-session',
+            session_id='f00c9104-cbc3-534f-9271-3414d3e80d87',
             status='submitted'
         )
         
@@ -710,7 +749,7 @@ class PublicProcessExecutionAPITestCase(APITestCase):
     def test_complete_process_not_found(self):
         """Test completing non-existent process progress"""
         url = f'/api/v1/public/processes/{self.public_process.unique_slug}/complete/'
-        data = {'session_id': 'non-existent-session'}
+        data = {'session_id': '1f44d04a-edf1-53b2-ab14-f51f3c335d50'}
         response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,23 @@
+"""
+URL path converters for the dynamic forms API.
+
+Importing this package registers them, so URLconfs that use a converter
+import it first.
+"""
+from django.urls import register_converter
+
+from shared.utils import session_uuid
+
+
+class SessionIdConverter:
+    """UUID session id; pre-UUID ids resolve to the UUID they migrated to"""
+    regex = '[^/]+'
+
+    def to_python(self, value):
+        return session_uuid(value)
+
+    def to_url(self, value):
+        return str(value)
+
+
+register_converter(SessionIdConverter, 'session_id')
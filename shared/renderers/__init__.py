@@ -0,0 +1,40 @@
+"""
+Response renderers for the dynamic forms API.
+"""
+from decimal import Decimal
+
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+_fallback_encoder = JSONEncoder()
+
+
+def _orjson_default(obj):
+    """Encode the types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)  # Same text DRF's DecimalField renders
+    if isinstance(obj, Promise):
+        return force_str(obj)  # Lazy translation strings in error messages
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    UUIDs and datetimes are encoded natively, UTC as 'Z' like DRF's
+    DateTimeField, so views can return values() rows without a serializer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            default=_orjson_default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
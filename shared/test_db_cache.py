@@ -0,0 +1,113 @@
+"""
+Test runner that caches the migrated test database as a PostgreSQL template.
+
+Enable with CACHE_TEST_DB=True. The first run migrates the test database as
+usual and then copies it to a template database whose name carries a hash of
+every migration file. Later runs clone that template with
+``CREATE DATABASE ... TEMPLATE ...`` instead of replaying the migrations.
+Editing, adding or removing a migration changes the hash, so the next run
+rebuilds the template.
+"""
+import hashlib
+import inspect
+
+from django.conf import settings
+from django.db import connections
+from django.db.migrations.loader import MigrationLoader
+from django.test.runner import DiscoverRunner
+
+
+def migrations_fingerprint():
+    """Hash the names and source of all migrations on disk"""
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    digest = hashlib.sha1()
+    for key in sorted(loader.disk_migrations):
+        migration = loader.disk_migrations[key]
+        digest.update(('%s.%s' % key).encode())
+        with open(inspect.getsourcefile(type(migration)), 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:12]
+
+
+class CachedSchemaTestRunner(DiscoverRunner):
+    """DiscoverRunner that clones the test database from a cached template"""
+
+    def setup_databases(self, **kwargs):
+        aliases = self._cacheable_aliases() if getattr(settings, 'TEST_DB_CACHE', False) else []
+        if not aliases:
+            return super().setup_databases(**kwargs)
+
+        fingerprint = migrations_fingerprint()
+        templates = {
+            alias: self._template_name(connections[alias], fingerprint)
+            for alias in aliases
+        }
+        missing = [
+            alias for alias in aliases
+            if not self._restore_from_template(connections[alias], templates[alias])
+        ]
+
+        # Restored databases are already migrated, so let Django treat them
+        # like a --keepdb run; teardown still honours the original flag.
+        keepdb = self.keepdb
+        self.keepdb = keepdb or len(missing) < len(aliases)
+        try:
+            old_config = super().setup_databases(**kwargs)
+        finally:
+            self.keepdb = keepdb
+
+        for alias in missing:
+            self._save_template(connections[alias], templates[alias], fingerprint)
+        return old_config
+
+    def _cacheable_aliases(self):
+        return [
+            alias for alias in connections
+            if connections[alias].vendor == 'postgresql'
+            and connections[alias].settings_dict['TEST'].get('MIGRATE', True)
+        ]
+
+    def _template_name(self, connection, fingerprint):
+        # Must be called before setup swaps NAME for the test database name
+        test_name = connection.creation._get_test_db_name()
+        return f'{test_name[:40]}_tpl_{fingerprint}'
+
+    def _database_exists(self, cursor, name):
+        cursor.execute('SELECT 1 FROM pg_database WHERE datname = %s', [name])
+        return cursor.fetchone() is not None
+
+    def _restore_from_template(self, connection, template):
+        """Create the test database from the template; False on cache miss"""
+        test_name = connection.creation._get_test_db_name()
+        quote = connection.ops.quote_name
+
+        with connection.creation._nodb_cursor() as cursor:
+            if not self._database_exists(cursor, template):
+                return False
+            if self._database_exists(cursor, test_name):
+                if self.keepdb:
+                    return True
+                cursor.execute(f'DROP DATABASE {quote(test_name)}')
+            cursor.execute(f'CREATE DATABASE {quote(test_name)} TEMPLATE {quote(template)}')
+        if self.verbosity >= 1:
+            self.log(f'Cloned test database for alias {connection.alias!r} from template {template!r}...')
+        return True
+
+    def _save_template(self, connection, template, fingerprint):
+        """Copy the freshly migrated test database into a new template"""
+        test_name = connection.settings_dict['NAME']
+        prefix = template[:-len(fingerprint)]
+        quote = connection.ops.quote_name
+
+        # CREATE DATABASE ... TEMPLATE requires no open sessions on the source.
+        connection.close()
+        with connection.creation._nodb_cursor() as cursor:
+            cursor.execute(
+                'SELECT datname FROM pg_database WHERE datname LIKE %s',
+                [prefix.replace('_', r'\_') + '%'],
+            )
+            for (stale,) in cursor.fetchall():
+                cursor.execute(f'DROP DATABASE {quote(stale)}')
+            cursor.execute(f'CREATE DATABASE {quote(template)} TEMPLATE {quote(test_name)}')
+        if self.verbosity >= 1:
+            self.log(f'Saved test database template {template!r} for alias {connection.alias!r}...')
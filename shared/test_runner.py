@@ -0,0 +1,56 @@
+"""
+Project test runner: the cached-schema runner plus a fast password hasher.
+
+Fixtures create users with passwords far more often than any test checks
+how those passwords are hashed, so the whole run uses a cheap hasher. The
+override is applied in the main process and again in each ``--parallel``
+worker, since workers started with spawn (the macOS and Windows default)
+reload settings from scratch instead of inheriting the parent's override.
+"""
+from django.conf import settings
+from django.test.runner import ParallelTestSuite
+from django.test.utils import override_settings
+
+from shared.test_db_cache import CachedSchemaTestRunner
+
+
+# Deliberately weak; only ever used while tests run
+TEST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+def enable_fast_hashers():
+    """Install TEST_PASSWORD_HASHERS and return the override to disable later"""
+    fast_hashers = override_settings(PASSWORD_HASHERS=TEST_PASSWORD_HASHERS)
+    fast_hashers.enable()
+    return fast_hashers
+
+
+def use_fast_hashers_in_worker():
+    """Install TEST_PASSWORD_HASHERS for the rest of a worker process"""
+    # Spawned workers call this before django.setup(); assigning the setting
+    # loads the settings module first, which override_settings would not
+    settings.PASSWORD_HASHERS = TEST_PASSWORD_HASHERS
+
+
+class FastHasherParallelTestSuite(ParallelTestSuite):
+    """ParallelTestSuite whose spawned workers also use the fast hasher"""
+
+    process_setup = use_fast_hashers_in_worker
+
+
+class FastPasswordHasherMixin:
+    """Test runner mixin that hashes passwords with TEST_PASSWORD_HASHERS"""
+
+    parallel_test_suite = FastHasherParallelTestSuite
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._fast_hashers = enable_fast_hashers()
+
+    def teardown_test_environment(self, **kwargs):
+        self._fast_hashers.disable()
+        super().teardown_test_environment(**kwargs)
+
+
+class TestRunner(FastPasswordHasherMixin, CachedSchemaTestRunner):
+    """Runner named by TEST_RUNNER"""
@@ -1,7 +1,25 @@
+"""
+Cross-app integration tests for the ERD relationships.
+
+The test cases here keep no module-level state and write nothing to the
+file system, so they are safe to run under ``manage.py test --parallel``.
+
+Relationship assertions are wrapped in assertNumQueries so that the query
+count of each check is an invariant: a new N+1 (for example a lost
+prefetch or select_related cache) fails the test instead of slipping in.
+"""
+import json
+import subprocess
+import sys
 import uuid
-from django.test import TestCase, TransactionTestCase
+import time
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
+from django.utils.translation import gettext_lazy
 from accounts.models import User
 from categories.models import Category
 from forms.models import Form, FormField, FieldOption
@@ -9,107 +27,115 @@ from processes.models import Process, ProcessStep
 from submissions.models import FormSubmission, SubmissionAnswer, ProcessProgress, ProcessStepCompletion
 from analytics.models import FormView, ProcessView
 from notifications.models import Notification, Webhook, NotificationLog
+from shared.renderers import ORJSONRenderer
+from shared.test_runner import TEST_PASSWORD_HASHERS, FastHasherParallelTestSuite
+from shared.utils import uuid7
 
 User = get_user_model()
 
 
-class ModelRelationshipsIntegrationTest(TransactionTestCase):
+class ModelRelationshipsIntegrationTest(TestCase):
     """Integration tests for all model relationships according to ERD"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up comprehensive test data"""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             email='test@example.com',
             first_name='John',
             last_name='Doe',
             password='testpass123'
         )
         
-        self.category = Category.objects.create(
-            user=self.user,
+        cls.category = Category.objects.create(
+            user=cls.user,
             name='HR Forms',
             color='#FF5733'
         )
         
-        self.form = Form.objects.create(
-            user=self.user,
-            category=self.category,
+        cls.form = Form.objects.create(
+            user=cls.user,
+            category=cls.category,
             title='Employee Feedback Form',
             unique_slug='employee-feedback-2024',
             visibility='public'
         )
         
-        self.field = FormField.objects.create(
-            form=self.form,
+        cls.field = FormField.objects.create(
+            form=cls.form,
             field_type='select',
             label='Satisfaction Level',
             order_index=0,
             is_required=True
         )
         
-        self.option = FieldOption.objects.create(
-            field=self.field,
+        cls.option = FieldOption.objects.create(
+            field=cls.field,
             label='Very Satisfied',
             value='5',
             order_index=0
         )
         
-        self.process = Process.objects.create(
-            user=self.user,
-            category=self.category,
+        cls.process = Process.objects.create(
+            user=cls.user,
+            category=cls.category,
             title='Employee Onboarding',
             unique_slug='employee-onboarding-2024',
             process_type='linear'
         )
         
-        self.step = ProcessStep.objects.create(
-            process=self.process,
-            form=self.form,
+        cls.step = ProcessStep.objects.create(
+            process=cls.process,
+            form=cls.form,
             title='Personal Information',
             order_index=0
         )
 
     def test_user_relationships(self):
         """Test all User model relationships"""
-        # Test direct relationships
-        self.assertIn(self.category, self.user.categories.all())
-        self.assertIn(self.form, self.user.forms.all())
-        self.assertIn(self.process, self.user.processes.all())
-        
-        # Test reverse relationships
-        self.assertEqual(self.category.user, self.user)
-        self.assertEqual(self.form.user, self.user)
-        self.assertEqual(self.process.user, self.user)
+        with self.assertNumQueries(3):
+            # Test direct relationships
+            self.assertIn(self.category, self.user.categories.all())
+            self.assertIn(self.form, self.user.forms.all())
+            self.assertIn(self.process, self.user.processes.all())
+        
+            # Test reverse relationships
+            self.assertEqual(self.category.user, self.user)
+            self.assertEqual(self.form.user, self.user)
+            self.assertEqual(self.process.user, self.user)
 
     def test_category_relationships(self):
         """Test Category model relationships"""
-        # Test forms relationship
-        self.assertIn(self.form, self.category.forms.all())
-        self.assertEqual(self.form.category, self.category)
-        
-        # Test processes relationship
-        self.assertIn(self.process, self.category.processes.all())
-        self.assertEqual(self.process.category, self.category)
+        with self.assertNumQueries(2):
+            # Test forms relationship
+            self.assertIn(self.form, self.category.forms.all())
+            self.assertEqual(self.form.category, self.category)
+        
+            # Test processes relationship
+            self.assertIn(self.process, self.category.processes.all())
+            self.assertEqual(self.process.category, self.category)
 
     def test_form_relationships(self):
         """Test Form model relationships"""
-        # Test fields relationship
-        self.assertIn(self.field, self.form.fields.all())
-        self.assertEqual(self.field.form, self.form)
-        
-        # Test options through field
-        self.assertIn(self.option, self.field.options.all())
-        self.assertEqual(self.option.field, self.field)
-        
-        # Test process steps relationship
-        self.assertIn(self.step, self.form.process_steps.all())
-        self.assertEqual(self.step.form, self.form)
+        with self.assertNumQueries(3):
+            # Test fields relationship
+            self.assertIn(self.field, self.form.fields.all())
+            self.assertEqual(self.field.form, self.form)
+        
+            # Test options through field
+            self.assertIn(self.option, self.field.options.all())
+            self.assertEqual(self.option.field, self.field)
+        
+            # Test process steps relationship
+            self.assertIn(self.step, self.form.process_steps.all())
+            self.assertEqual(self.step.form, self.form)
 
     def test_process_relationships(self):
         """Test Process model relationships"""
-        # Test steps relationship
-        self.assertIn(self.step, self.process.steps.all())
-        self.assertEqual(self.step.process, self.process)
+        with self.assertNumQueries(1):
+            # Test steps relationship
+            self.assertIn(self.step, self.process.steps.all())
+            self.assertEqual(self.step.process, self.process)
 
     def test_submission_workflow(self):
         """Test complete submission workflow"""
@@ -117,7 +143,7 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         submission = FormSubmission.objects.create(
             form=self.form,
             user=self.user,
-            session_id='test-session-123',
+            session_id='0b90c2be-4510-5921-9805-5df5697c4dd9',
             status='submitted'
         )
         
@@ -128,14 +154,18 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
             text_value='Very Satisfied'
         )
         
-        # Test relationships
-        self.assertIn(answer, submission.answers.all())
-        self.assertEqual(answer.submission, submission)
-        self.assertEqual(answer.field, self.field)
-        
-        # Test form relationship
-        self.assertIn(submission, self.form.submissions.all())
-        self.assertEqual(submission.form, self.form)
+        prefetch_related_objects([submission], 'answers')
+        prefetch_related_objects([self.form], 'submissions')
+        
+        with self.assertNumQueries(0):
+            # Test relationships
+            self.assertIn(answer, submission.answers.all())
+            self.assertEqual(answer.submission, submission)
+            self.assertEqual(answer.field, self.field)
+            
+            # Test form relationship
+            self.assertIn(submission, self.form.submissions.all())
+            self.assertEqual(submission.form, self.form)
 
     def test_process_progress_workflow(self):
         """Test complete process progress workflow"""
@@ -143,7 +173,7 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         progress = ProcessProgress.objects.create(
             process=self.process,
             user=self.user,
-            session_id='test-session-456',
+            session_id='f48a906a-5470-58f4-94ed-04b615e7f43f',
             status='in_progress',
             current_step_index=0,
             completion_percentage=25.00
@@ -153,7 +183,7 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         submission = FormSubmission.objects.create(
             form=self.form,
             user=self.user,
-            session_id='test-session-456',
+            session_id='f48a906a-5470-58f4-94ed-04b615e7f43f',
             status='submitted',
             process_progress=progress
         )
@@ -166,38 +196,44 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
             status='completed'
         )
         
-        # Test relationships
-        self.assertIn(completion, progress.step_completions.all())
-        self.assertEqual(completion.progress, progress)
-        self.assertEqual(completion.step, self.step)
-        self.assertEqual(completion.submission, submission)
-        
-        # Test process relationship
-        self.assertIn(progress, self.process.progress_records.all())
-        self.assertEqual(progress.process, self.process)
+        prefetch_related_objects([progress], 'step_completions', 'submissions')
+        prefetch_related_objects([self.process], 'progress_records')
+        
+        with self.assertNumQueries(0):
+            # Test relationships
+            self.assertIn(completion, progress.step_completions.all())
+            self.assertIn(submission, progress.submissions.all())
+            self.assertEqual(completion.progress, progress)
+            self.assertEqual(completion.step, self.step)
+            self.assertEqual(completion.submission, submission)
+            
+            # Test process relationship
+            self.assertIn(progress, self.process.progress_records.all())
+            self.assertEqual(progress.process, self.process)
 
     def test_analytics_relationships(self):
         """Test analytics model relationships"""
         # Create form view
         form_view = FormView.objects.create(
             form=self.form,
-            session_id='test-session-view',
+            session_id='58c43bdc-cd0a-5e66-b8f1-a8f5c7327fcd',
             ip_address='192.168.1.1'
         )
         
         # Create process view
         process_view = ProcessView.objects.create(
             process=self.process,
-            session_id='test-session-view',
+            session_id='58c43bdc-cd0a-5e66-b8f1-a8f5c7327fcd',
             ip_address='192.168.1.1'
         )
         
-        # Test relationships
-        self.assertIn(form_view, self.form.views.all())
-        self.assertEqual(form_view.form, self.form)
+        with self.assertNumQueries(2):
+            # Test relationships
+            self.assertIn(form_view, self.form.views.all())
+            self.assertEqual(form_view.form, self.form)
         
-        self.assertIn(process_view, self.process.views.all())
-        self.assertEqual(process_view.process, self.process)
+            self.assertIn(process_view, self.process.views.all())
+            self.assertEqual(process_view.process, self.process)
 
     def test_notification_relationships(self):
         """Test notification model relationships"""
@@ -224,15 +260,19 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
             status='sent'
         )
         
-        # Test relationships
-        self.assertIn(notification, self.user.notifications.all())
-        self.assertEqual(notification.user, self.user)
-        
-        self.assertIn(webhook, self.user.webhooks.all())
-        self.assertEqual(webhook.user, self.user)
-        
-        self.assertIn(log, notification.logs.all())
-        self.assertEqual(log.notification, notification)
+        prefetch_related_objects([self.user], 'notifications', 'webhooks')
+        prefetch_related_objects([notification], 'logs')
+        
+        with self.assertNumQueries(0):
+            # Test relationships
+            self.assertIn(notification, self.user.notifications.all())
+            self.assertEqual(notification.user, self.user)
+            
+            self.assertIn(webhook, self.user.webhooks.all())
+            self.assertEqual(webhook.user, self.user)
+            
+            self.assertIn(log, notification.logs.all())
+            self.assertEqual(log.notification, notification)
 
     def test_cascade_deletes(self):
         """Test cascade delete behavior"""
@@ -240,7 +280,7 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         submission = FormSubmission.objects.create(
             form=self.form,
             user=self.user,
-            session_id='test-cascade',
+            session_id='c915b89b-88b2-5d59-a063-9f8b53e2d689',
             status='submitted'
         )
         
@@ -254,12 +294,15 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         form_id = self.form.id
         self.form.delete()
         
-        # Verify cascade deletes
-        self.assertFalse(Form.objects.filter(id=form_id).exists())
-        self.assertFalse(FormField.objects.filter(form_id=form_id).exists())
-        self.assertFalse(FieldOption.objects.filter(field__form_id=form_id).exists())
-        self.assertFalse(FormSubmission.objects.filter(form_id=form_id).exists())
-        self.assertFalse(SubmissionAnswer.objects.filter(submission__form_id=form_id).exists())
+        # Verify cascade deletes with a single UNION query
+        leftovers = Form.objects.filter(id=form_id).values_list('id').union(
+            FormField.objects.filter(form_id=form_id).values_list('id'),
+            FieldOption.objects.filter(field__form_id=form_id).values_list('id'),
+            FormSubmission.objects.filter(form_id=form_id).values_list('id'),
+            SubmissionAnswer.objects.filter(submission__form_id=form_id).values_list('id'),
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(list(leftovers), [])
 
     def test_foreign_key_constraints(self):
         """Test foreign key constraints"""
@@ -268,7 +311,7 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
             with transaction.atomic():
                 FormSubmission.objects.create(
                     user=self.user,
-                    session_id='test-constraint',
+                    session_id='9b015cf9-92a5-519c-b439-a6ac04ae81fd',
                     status='submitted'
                 )
         
@@ -276,7 +319,7 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         submission = FormSubmission.objects.create(
             form=self.form,
             user=self.user,
-            session_id='test-constraint-answer',
+            session_id='b25a2e5a-7326-5b2b-9eb1-85c30949ca2a',
             status='submitted'
         )
         
@@ -348,9 +391,10 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         ]
         
         for model, expected_table in models_to_test:
-            self.assertEqual(model._meta.db_table, expected_table)
-            self.assertTrue(hasattr(model, 'id'))
-            self.assertEqual(model._meta.get_field('id').__class__.__name__, 'UUIDField')
+            with self.subTest(model=model.__name__):
+                self.assertEqual(model._meta.db_table, expected_table)
+                self.assertTrue(hasattr(model, 'id'))
+                self.assertEqual(model._meta.get_field('id').__class__.__name__, 'UUIDField')
 
     def test_json_field_consistency(self):
         """Test that JSON fields work consistently across models"""
@@ -379,38 +423,100 @@ class ModelRelationshipsIntegrationTest(TransactionTestCase):
         submission = FormSubmission.objects.create(
             form=form,
             user=self.user,
-            session_id='json-test',
+            session_id='cdfc24e7-a785-5a74-95d6-6d5540ab2aa3',
             status='submitted',
             metadata={'device': 'mobile', 'browser': 'safari'}
         )
         self.assertIsInstance(submission.metadata, dict)
         self.assertEqual(submission.metadata['device'], 'mobile')
+        self.assertTrue(FormSubmission.objects.filter(metadata__contains={'device': 'mobile'}).exists())
+        self.assertFalse(FormSubmission.objects.filter(metadata__contains={'device': 'desktop'}).exists())
 
     def test_model_string_representations(self):
         """Test that all models have meaningful string representations"""
-        # Test user
-        self.assertEqual(str(self.user), 'test@example.com')
-        
-        # Test category
-        expected_category = f"HR Forms ({self.user.email})"
-        self.assertEqual(str(self.category), expected_category)
-        
-        # Test form
-        expected_form = "Employee Feedback Form (employee-feedback-2024)"
-        self.assertEqual(str(self.form), expected_form)
-        
-        # Test field
-        expected_field = "Satisfaction Level (Employee Feedback Form)"
-        self.assertEqual(str(self.field), expected_field)
-        
-        # Test option
-        expected_option = "Very Satisfied (Satisfaction Level)"
-        self.assertEqual(str(self.option), expected_option)
-        
-        # Test process
-        expected_process = "Employee Onboarding (employee-onboarding-2024)"
-        self.assertEqual(str(self.process), expected_process)
+        cases = [
+            (self.user, 'test@example.com'),
+            (self.category, f"HR Forms ({self.user.email})"),
+            (self.form, "Employee Feedback Form (employee-feedback-2024)"),
+            (self.field, "Satisfaction Level (Employee Feedback Form)"),
+            (self.option, "Very Satisfied (Satisfaction Level)"),
+            (self.process, "Employee Onboarding (employee-onboarding-2024)"),
+            (self.step, "Personal Information (Employee Onboarding)"),
+        ]
         
-        # Test step
-        expected_step = "Personal Information (Employee Onboarding)"
-        self.assertEqual(str(self.step), expected_step)
+        for obj, expected in cases:
+            with self.subTest(model=type(obj).__name__):
+                self.assertEqual(str(obj), expected)
+
+
+class UUID7Test(TestCase):
+    """Tests for the time-ordered UUID generator"""
+
+    def test_uuid7_version_and_variant(self):
+        """Test generated values are RFC 9562 version 7 UUIDs"""
+        value = uuid7()
+        self.assertIsInstance(value, uuid.UUID)
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_uuid7_is_time_ordered(self):
+        """Test values generated later sort after earlier ones"""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        self.assertLess(first, second)
+
+    def test_submission_ids_are_uuid7(self):
+        """Test high-volume submission tables default to uuid7 primary keys"""
+        for model in [FormSubmission, SubmissionAnswer, ProcessProgress, ProcessStepCompletion]:
+            self.assertIs(model._meta.pk.default, uuid7)
+
+
+class ORJSONRendererTest(TestCase):
+    """Tests for the orjson-backed DRF renderer"""
+
+    def test_renders_like_drf_serializer_fields(self):
+        """Test native values encode as DRF serializer fields would render them"""
+        value = uuid.uuid4()
+        moment = datetime(2026, 1, 2, 3, 4, 5, 6000, tzinfo=dt_timezone.utc)
+        rendered = json.loads(ORJSONRenderer().render({
+            'id': value,
+            'at': moment,
+            'amount': Decimal('1.500000'),
+            'message': gettext_lazy('Not found.'),
+        }))
+        self.assertEqual(rendered, {
+            'id': str(value),
+            'at': '2026-01-02T03:04:05.006000Z',
+            'amount': '1.500000',
+            'message': 'Not found.',
+        })
+
+    def test_renders_none_as_empty_body(self):
+        """Test empty responses such as 204/304 have no body"""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+
+class TestRunnerHasherTest(TestCase):
+    """Tests for the password hasher the test runner installs"""
+
+    def test_users_get_fast_test_hash(self):
+        """Test fixture passwords use the fast test hasher and still verify"""
+        user = User.objects.create_user(email='hasher@example.com', password='testpass123')
+        self.assertTrue(user.password.startswith('md5$'))
+        self.assertTrue(user.check_password('testpass123'))
+
+    def test_spawned_workers_get_fast_test_hash(self):
+        """Test --parallel workers started with spawn install the fast hasher too"""
+        # A fresh interpreter stands in for a spawned worker, which inherits
+        # nothing from this process's override
+        worker = subprocess.run(
+            [sys.executable, '-c', (
+                'from shared.test_runner import FastHasherParallelTestSuite\n'
+                'FastHasherParallelTestSuite.process_setup()\n'
+                'from django.conf import settings\n'
+                'print(settings.PASSWORD_HASHERS)'
+            )],
+            capture_output=True, text=True, timeout=60, check=True
+        )
+        self.assertEqual(worker.stdout.strip(), str(TEST_PASSWORD_HASHERS))
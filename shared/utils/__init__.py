@@ -0,0 +1,48 @@
+"""
+Shared utility helpers for the dynamic forms system.
+"""
+import os
+import time
+import uuid
+
+
+def uuid7():
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits hold the Unix timestamp in milliseconds, so values
+    created later sort after earlier ones and primary key inserts append to
+    the right-hand side of the B-tree index instead of landing on random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a
+    value |= 0b10 << 62                         # variant
+    value |= rand & 0x3FFFFFFFFFFFFFFF          # rand_b
+    return uuid.UUID(int=value)
+
+
+# Namespace submissions migration 0002 used to turn legacy Django session
+# keys into UUID session ids; must never change
+LEGACY_SESSION_NAMESPACE = uuid.UUID('6f1c2f8e-8d4b-4a57-9d0e-2b1f3f7c9a10')
+
+
+def legacy_session_uuid(session_key):
+    """The UUID session id migration 0002 gave records stored under session_key"""
+    return uuid.uuid5(LEGACY_SESSION_NAMESPACE, str(session_key))
+
+
+def session_uuid(value):
+    """
+    UUID for a session id sent by a client
+
+    Clients may still hold a session id from before ids became UUIDs;
+    migration 0002 moved those records to legacy_session_uuid(value).
+    """
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return legacy_session_uuid(value)
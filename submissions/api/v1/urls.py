@@ -1,6 +1,7 @@
 from django.urls import path
 from submissions.views import PublicFormViewSet
 from submissions.owner_views import SubmissionManagementViewSet
+import shared.converters  # noqa: F401 - registers <session_id:...>
 
 app_name = 'submissions'
 
@@ -56,7 +57,7 @@ urlpatterns = [
 
     # Get/Update draft
     path(
-        'public/forms/<slug:slug>/submissions/draft/<str:session_id>/',
+        'public/forms/<slug:slug>/submissions/draft/<session_id:session_id>/',
         PublicFormViewSet.as_view({
             'get': 'get_draft',
             'patch': 'update_draft'
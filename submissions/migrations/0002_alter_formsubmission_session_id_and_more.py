@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:17
+
+import uuid
+
+from django.db import migrations, models
+
+
+# Legacy session ids that are not valid UUIDs are mapped deterministically so
+# that submissions and progress records sharing a session keep matching.
+LEGACY_SESSION_NAMESPACE = uuid.UUID('6f1c2f8e-8d4b-4a57-9d0e-2b1f3f7c9a10')
+
+
+def _to_uuid(value):
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return uuid.uuid5(LEGACY_SESSION_NAMESPACE, str(value))
+
+
+def normalize_session_ids(apps, schema_editor):
+    """Rewrite session_id values into canonical UUID text before the type change"""
+    for model_name in ('FormSubmission', 'ProcessProgress'):
+        model = apps.get_model('submissions', model_name)
+        for pk, session_id in model.objects.values_list('pk', 'session_id').iterator():
+            normalized = str(_to_uuid(session_id))
+            if normalized != session_id:
+                model.objects.filter(pk=pk).update(session_id=normalized)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submissions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_session_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='formsubmission',
+            name='session_id',
+            field=models.UUIDField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='processprogress',
+            name='session_id',
+            field=models.UUIDField(db_index=True),
+        ),
+    ]
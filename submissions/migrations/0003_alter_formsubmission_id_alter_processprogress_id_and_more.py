@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:29
+
+import shared.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('submissions', '0002_alter_formsubmission_session_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='formsubmission',
+            name='id',
+            field=models.UUIDField(default=shared.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='processprogress',
+            name='id',
+            field=models.UUIDField(default=shared.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='processstepcompletion',
+            name='id',
+            field=models.UUIDField(default=shared.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='submissionanswer',
+            name='id',
+            field=models.UUIDField(default=shared.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0001_initial'),
+        ('submissions', '0003_alter_formsubmission_id_alter_processprogress_id_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='formsubmission',
+            name='form_submis_submitt_3b1a0f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='formsubmission',
+            index=models.Index(condition=models.Q(('submitted_at__isnull', False)), fields=['-submitted_at'], name='sub_submitted_at_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('processes', '0001_initial'),
+        ('submissions', '0004_remove_formsubmission_form_submis_submitt_3b1a0f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='processstepcompletion',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='processstepcompletion',
+            name='progress',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='step_completions', to='submissions.processprogress'),
+        ),
+        migrations.AddConstraint(
+            model_name='processstepcompletion',
+            constraint=models.UniqueConstraint(fields=('progress', 'step'), name='progress_step_unique'),
+        ),
+    ]
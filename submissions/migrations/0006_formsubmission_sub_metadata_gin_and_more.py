@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:42
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0001_initial'),
+        ('submissions', '0005_alter_processstepcompletion_unique_together_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formsubmission',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['metadata'], name='sub_metadata_gin', opclasses=['jsonb_path_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='submissionanswer',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['array_value'], name='answer_array_value_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0001_initial'),
+        ('submissions', '0006_formsubmission_sub_metadata_gin_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formsubmission',
+            index=models.Index(fields=['form', '-created_at', 'status'], name='sub_form_created_idx'),
+        ),
+    ]
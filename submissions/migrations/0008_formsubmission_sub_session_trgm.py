@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-17 03:52
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_email_trgm'),  # creates the pg_trgm extension
+        ('forms', '0001_initial'),
+        ('submissions', '0007_formsubmission_sub_form_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formsubmission',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('session_id', models.TextField())), name='gin_trgm_ops'), name='sub_session_trgm'),
+        ),
+    ]
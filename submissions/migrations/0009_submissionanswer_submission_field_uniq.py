@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 05:24
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Q
+
+
+def drop_duplicate_answers(apps, schema_editor):
+    """Keep the newest answer per submission and field before adding the constraint"""
+    SubmissionAnswer = apps.get_model('submissions', 'SubmissionAnswer')
+    # Older rows have uuid4 ids, so the id only breaks created_at ties
+    newer = SubmissionAnswer.objects.filter(
+        Q(created_at__gt=OuterRef('created_at'))
+        | Q(created_at=OuterRef('created_at'), id__gt=OuterRef('id')),
+        submission=OuterRef('submission'),
+        field=OuterRef('field'),
+    )
+    SubmissionAnswer.objects.filter(Exists(newer)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0002_form_submission_count'),
+        ('submissions', '0008_formsubmission_sub_session_trgm'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_answers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='submissionanswer',
+            constraint=models.UniqueConstraint(fields=('submission', 'field'), name='answer_submission_field_uniq'),
+        ),
+    ]
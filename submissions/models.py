@@ -1,7 +1,17 @@
-import uuid
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Cast, Upper
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MinValueValidator, MaxValueValidator
+from shared.utils import uuid7
+
+
+class SubmissionListManager(models.Manager):
+    """Manager for list pages that skips loading the metadata JSON blob"""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('metadata')
 
 
 class FormSubmission(models.Model):
@@ -14,7 +24,7 @@ class FormSubmission(models.Model):
         ('archived', 'Archived'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     form = models.ForeignKey(
         'forms.Form',
         on_delete=models.CASCADE,
@@ -34,13 +44,16 @@ class FormSubmission(models.Model):
         blank=True,
         related_name='submissions'
     )
-    session_id = models.CharField(max_length=255, db_index=True)
+    session_id = models.UUIDField(db_index=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='draft')
     metadata = models.JSONField(default=dict, blank=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    list_objects = SubmissionListManager()
+
     class Meta:
         db_table = 'form_submission'
         indexes = [
@@ -48,8 +61,22 @@ class FormSubmission(models.Model):
             models.Index(fields=['user']),
             models.Index(fields=['session_id']),
             models.Index(fields=['status']),
-            models.Index(fields=['submitted_at']),
+            # Drafts have no submitted_at, so keep them out of the index
+            models.Index(
+                fields=['-submitted_at'],
+                condition=Q(submitted_at__isnull=False),
+                name='sub_submitted_at_idx',
+            ),
             models.Index(fields=['process_progress']),
+            # Trigram index matching Django's session_id__icontains SQL (UPPER(session_id::text) LIKE ...)
+            GinIndex(
+                OpClass(Upper(Cast('session_id', models.TextField())), name='gin_trgm_ops'),
+                name='sub_session_trgm',
+            ),
+            # Owner list pages: filter by form, newest first (keyset on created_at)
+            models.Index(fields=['form', '-created_at', 'status'], name='sub_form_created_idx'),
+            # Serves metadata containment filters (metadata__contains={...})
+            GinIndex(fields=['metadata'], name='sub_metadata_gin', opclasses=['jsonb_path_ops']),
         ]
 
     def __str__(self):
@@ -60,7 +87,7 @@ class SubmissionAnswer(models.Model):
     """
     Individual field responses within a submission
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     submission = models.ForeignKey(
         FormSubmission,
         on_delete=models.CASCADE,
@@ -90,6 +117,12 @@ class SubmissionAnswer(models.Model):
             models.Index(fields=['submission']),
             models.Index(fields=['field']),
             models.Index(fields=['field', 'numeric_value']),
+            # Serves multi-select containment filters (array_value__contains=[...])
+            GinIndex(fields=['array_value'], name='answer_array_value_gin', opclasses=['jsonb_path_ops']),
+        ]
+        constraints = [
+            # One answer per field; multi-select values live in array_value
+            models.UniqueConstraint(fields=['submission', 'field'], name='answer_submission_field_uniq'),
         ]
 
     def __str__(self):
@@ -106,7 +139,7 @@ class ProcessProgress(models.Model):
         ('abandoned', 'Abandoned'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     process = models.ForeignKey(
         'processes.Process',
         on_delete=models.CASCADE,
@@ -119,7 +152,7 @@ class ProcessProgress(models.Model):
         blank=True,
         related_name='process_progress'
     )
-    session_id = models.CharField(max_length=255, db_index=True)
+    session_id = models.UUIDField(db_index=True)
     status = models.CharField(max_length=15, choices=STATUS_CHOICES, default='in_progress')
     current_step_index = models.PositiveIntegerField(
         validators=[MinValueValidator(0)],
@@ -161,11 +194,14 @@ class ProcessStepCompletion(models.Model):
         ('skipped', 'Skipped'),
     ]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # No standalone index: progress is the leading column of the unique
+    # (progress, step) constraint, which already serves progress lookups
     progress = models.ForeignKey(
         ProcessProgress,
         on_delete=models.CASCADE,
-        related_name='step_completions'
+        related_name='step_completions',
+        db_index=False
     )
     step = models.ForeignKey(
         'processes.ProcessStep',
@@ -186,7 +222,9 @@ class ProcessStepCompletion(models.Model):
 
     class Meta:
         db_table = 'process_step_completion'
-        unique_together = [['progress', 'step']]
+        constraints = [
+            models.UniqueConstraint(fields=['progress', 'step'], name='progress_step_unique'),
+        ]
 
     def __str__(self):
         return f"Step completion for {self.step.title} - {self.status}"
\ No newline at end of file
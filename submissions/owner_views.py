@@ -2,27 +2,188 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import BrowsableAPIRenderer
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Avg, Q, F
-from django.db.models.functions import TruncDate
-from django.http import HttpResponse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.db import transaction
+from django.db.models import (
+    Count, Avg, Max, Min, Q, F, Func, Case, When, Value, TextField
+)
+from django.db.models.functions import TruncDate, Cast, Coalesce, NullIf
+from django.db.models.signals import pre_delete, post_delete
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.dateparse import parse_datetime
+from asgiref.sync import sync_to_async
 import csv
-import json
+import hashlib
+import orjson
+import tempfile
+import uuid
+from collections import defaultdict
 from datetime import timedelta
 
 from submissions.models import FormSubmission, SubmissionAnswer
 from forms.models import Form
+from shared.renderers import ORJSONRenderer
 
 from .serializers import (
     FormSubmissionReadSerializer,
+    FormSubmissionListSerializer,
     FormSubmissionDetailSerializer,
     SubmissionStatsSerializer,
     BulkDeleteSerializer,
     ExportSerializer
 )
 
+User = get_user_model()
+
+
+# Rows fetched per database round trip when streaming exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Seconds a computed statistics payload stays cached for polling dashboards
+STATS_CACHE_TIMEOUT = 60
+
+
+# SubmissionAnswer columns that hold the answer value
+ANSWER_VALUE_COLUMNS = (
+    'text_value', 'numeric_value', 'boolean_value',
+    'date_value', 'array_value', 'file_url'
+)
+
+
+# Export text for text, numeric and boolean answers, rendered by PostgreSQL.
+# Dates, multi-select arrays and files are NULL here and formatted in Python
+# by _format_answer_value, keeping their ISO / comma-joined output unchanged.
+ANSWER_EXPORT_VALUE = Coalesce(
+    NullIf('text_value', Value('')),
+    Cast('numeric_value', TextField()),
+    Case(
+        When(boolean_value=True, then=Value('Yes')),
+        When(boolean_value=False, then=Value('No')),
+    ),
+    output_field=TextField(),
+)
+
+
+# submitted_at as text in the datetime.isoformat() form of the UTC values the
+# database returns, except that zero microseconds are still printed
+SUBMITTED_AT_EXPORT_VALUE = Func(
+    F('submitted_at'),
+    template="to_char(%(expressions)s AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS.US\"+00:00\"')",
+    output_field=TextField(),
+)
+
+
+class Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output"""
+
+    def write(self, value):
+        return value
+
+
+class ExportStreamingResponse(StreamingHttpResponse):
+    """
+    StreamingHttpResponse that also streams its sync iterator under ASGI
+
+    Django's own __aiter__ collects a sync iterator into a list before
+    sending it. This pulls one chunk at a time through the thread-sensitive
+    executor instead, so the export's server-side cursor stays on the
+    thread that opened it and memory stays flat.
+    """
+
+    async def __aiter__(self):
+        chunks = self.streaming_content
+        next_chunk = sync_to_async(next, thread_sensitive=True)
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+
+
+class SubmissionPaginator(Paginator):
+    """
+    Paginator that skips the page query once COUNT(*) says there are no rows
+
+    A count the caller already knows replaces the COUNT(*) query; the page
+    is fetched with one extra row to check it, and a count the rows
+    contradict is replaced by COUNT(*).
+    """
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.known_count = count
+        if count is not None:
+            self.count = count
+
+    def validate_number(self, number):
+        """Accept pages past the end; the list returns them empty, not 404"""
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        if self.known_count is not None:
+            return self._known_count_page(number)
+        number = self.validate_number(number)
+        if self.count == 0 or number > self.num_pages:
+            return self._get_page([], number, self)
+        return super().page(number)
+
+    def _known_count_page(self, number):
+        try:
+            number = self.validate_number(number)
+        except EmptyPage:
+            return self._recount_page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if len(rows) != max(0, min(self.count - bottom, self.per_page + 1)):
+            return self._recount_page(number)
+        return self._get_page(rows[:self.per_page], number, self)
+
+    def _recount_page(self, number):
+        # The stored count has drifted from the table
+        self.known_count = None
+        del self.count
+        return self.page(number)
+
+
+class SubmissionPagination(PageNumberPagination):
+    """Page-number pagination keeping the submission list response shape"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    # Deeper pages make PostgreSQL walk and discard every skipped row
+    max_offset = 10000
+
+    # Total row count, when the view knows it without running COUNT(*)
+    known_count = None
+
+    def django_paginator_class(self, object_list, per_page):
+        return SubmissionPaginator(object_list, per_page, count=self.known_count)
+
+    def exceeds_max_offset(self, request):
+        page_number = request.query_params.get(self.page_query_param, '')
+        if not page_number.isdigit():
+            return False  # 'last' and invalid numbers are handled by paginate_queryset
+        return (int(page_number) - 1) * self.get_page_size(request) > self.max_offset
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.page.paginator.count,
+            'page': self.page.number,
+            'page_size': self.page.paginator.per_page,
+            'total_pages': self.page.paginator.num_pages,
+            'results': data
+        })
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -52,6 +213,13 @@ from .serializers import (
                 description='Filter to date (YYYY-MM-DD)',
                 required=False
             ),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='next_cursor from a previous page, or an ISO datetime; return older submissions without a total count',
+                required=False
+            ),
             OpenApiParameter(
                 name='search',
                 type=str,
@@ -60,7 +228,7 @@ from .serializers import (
                 required=False
             ),
         ],
-        responses={200: FormSubmissionReadSerializer(many=True)}
+        responses={200: FormSubmissionListSerializer(many=True)}
     ),
     retrieve=extend_schema(
         tags=['Submissions'],
@@ -92,22 +260,63 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
     permission_classes = [IsAuthenticated]
     lookup_field = 'id'
     serializer_class = FormSubmissionReadSerializer  # Default serializer for schema generation
+    pagination_class = SubmissionPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
-        """Get submissions for user's form"""
+        """
+        Get submissions for user's form
+
+        Loads everything FormSubmissionDetailSerializer reads (form, user,
+        answers and each answer's field) up front; retrieve is pinned to a
+        fixed query count however many answers a submission has.
+        """
+        form = self.get_form()
+        return FormSubmissionDetailSerializer.setup_eager_loading(
+            FormSubmission.objects.filter(form=form)
+        ).order_by('-created_at')
+
+    def get_list_queryset(self):
+        """
+        Get submissions for the list page as values() rows
+
+        Goes through FormSubmission.list_objects and reads only the columns
+        the list renders; _list_rows() adds the answers and form title.
+        """
         form = self.get_form()
-        return FormSubmission.objects.filter(form=form).prefetch_related(
-            'answers__field', 'user'
+        return FormSubmission.list_objects.filter(form=form).values(
+            'id', 'session_id', 'status', 'submitted_at', 'created_at', 'updated_at',
+            'user__email'
         ).order_by('-created_at')
 
+    def _decrement_submission_count(self, form_id, count):
+        """
+        Take deleted submissions off Form.submission_count in one UPDATE
+
+        submissions.signals only counts creates; a post_delete receiver
+        would stop QuerySet.delete() from batching, so every path that
+        deletes submissions adjusts the counter itself.
+        """
+        if count:
+            Form.objects.filter(pk=form_id).update(
+                submission_count=F('submission_count') - count
+            )
+
     def get_form(self):
-        """Get form from URL - must belong to current user"""
-        form_slug = self.kwargs.get('slug')
-        return get_object_or_404(
-            Form,
-            unique_slug=form_slug,
-            user=self.request.user  # Only owner's forms
-        )
+        """
+        Get form from URL - must belong to current user
+
+        Cached on the view instance, which lives for a single request, so
+        get_queryset() and the action body share one Form lookup.
+        """
+        if not hasattr(self, '_form'):
+            form_slug = self.kwargs.get('slug')
+            self._form = get_object_or_404(
+                Form,
+                unique_slug=form_slug,
+                user=self.request.user  # Only owner's forms
+            )
+        return self._form
 
     def list(self, request, slug=None):
         """
@@ -120,9 +329,15 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         - date_to: filter submissions to date
         - search: search in user email or session_id
         - page: pagination
-        - page_size: items per page
+        - page_size: items per page (max 100)
+        - cursor: next_cursor from a previous page, or an ISO datetime;
+          returns older submissions without a total count
         """
-        queryset = self.get_queryset()
+        queryset = self.get_list_queryset()
+
+        # Without filters the total is the form's maintained counter
+        if not request.query_params.keys() & {'status', 'date_from', 'date_to', 'search'}:
+            self.paginator.known_count = self.get_form().submission_count
 
         # Filters
         status_filter = request.query_params.get('status')
@@ -139,28 +354,94 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
 
         search = request.query_params.get('search')
         if search:
+            # Both icontains lookups are served by pg_trgm GIN indexes; the
+            # email match runs as a subquery so it can use user_email_trgm
+            # instead of filtering the joined rows
             queryset = queryset.filter(
-                Q(user__email__icontains=search) |
+                Q(user__in=User.objects.filter(email__icontains=search)) |
                 Q(session_id__icontains=search)
             )
 
-        # Pagination
-        page = int(request.query_params.get('page', 1))
-        page_size = int(request.query_params.get('page_size', 20))
+        # Keyset pagination: no COUNT(*), walks the (form, created_at) index
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            return self._keyset_page(request, queryset, cursor)
+
+        if self.paginator.exceeds_max_offset(request):
+            return Response({
+                'error': 'Use cursor pagination for deep offsets'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        page = self.paginate_queryset(queryset)
+        if self.paginator.known_count is not None and self.paginator.page.paginator.known_count is None:
+            # The counter disagreed with the rows; store the fresh COUNT(*)
+            Form.objects.filter(pk=self.get_form().pk).update(
+                submission_count=self.paginator.page.paginator.count
+            )
+        return self.get_paginated_response(self._list_rows(page))
+
+    def _list_rows(self, submissions):
+        """
+        Shape values() rows like FormSubmissionListSerializer without running
+        it; ORJSONRenderer encodes the raw UUID, datetime and Decimal values
+        """
+        answers = defaultdict(list)
+        for answer in SubmissionAnswer.objects.filter(
+            submission_id__in=[submission['id'] for submission in submissions]
+        ).values('submission_id', 'id', *ANSWER_VALUE_COLUMNS):
+            answers[answer.pop('submission_id')].append(answer)
+
+        form_title = self.get_form().title
+        return [
+            {
+                'id': submission['id'],
+                'form_title': form_title,
+                'user_email': submission['user__email'],
+                'session_id': submission['session_id'],
+                'status': submission['status'],
+                'answers': answers.get(submission['id'], []),
+                'submitted_at': submission['submitted_at'],
+                'created_at': submission['created_at'],
+                'updated_at': submission['updated_at'],
+            }
+            for submission in submissions
+        ]
+
+    def _keyset_page(self, request, queryset, cursor):
+        """
+        Return submissions older than the cursor, without a count
+
+        The cursor is "<created_at>_<id>" of the last row already seen, so
+        rows sharing a timestamp at the page boundary are neither skipped
+        nor repeated. A bare ISO datetime starts before that moment.
+        """
+        created_at, _, last_id = cursor.partition('_')
+        created_before = parse_datetime(created_at)
+        try:
+            last_id = uuid.UUID(last_id) if last_id else None
+        except ValueError:
+            created_before = None
+        if created_before is None:
+            return Response({
+                'error': 'cursor must be a next_cursor value or an ISO 8601 datetime'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        older = Q(created_at__lt=created_before)
+        if last_id is not None:
+            older |= Q(created_at=created_before, id__lt=last_id)
 
-        total = queryset.count()
-        start = (page - 1) * page_size
-        end = start + page_size
+        page_size = self.paginator.get_page_size(request)
+        submissions = list(queryset.filter(older).order_by('-created_at', '-id')[:page_size])
 
-        submissions = queryset[start:end]
-        serializer = FormSubmissionReadSerializer(submissions, many=True)
+        next_cursor = None
+        if len(submissions) == page_size:
+            last = submissions[-1]
+            next_cursor = f"{last['created_at'].isoformat()}_{last['id']}"
 
         return Response({
-            'count': total,
-            'page': page,
             'page_size': page_size,
-            'total_pages': (total + page_size - 1) // page_size,
-            'results': serializer.data
+            'next_cursor': next_cursor,
+            'results': self._list_rows(submissions)
         })
 
     def retrieve(self, request, slug=None, id=None):
@@ -186,7 +467,9 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
             id=id
         )
 
-        submission.delete()
+        with transaction.atomic():
+            deleted = submission.delete()[1].get(FormSubmission._meta.label, 0)
+            self._decrement_submission_count(submission.form_id, deleted)
 
         return Response({
             'message': 'Submission deleted successfully'
@@ -204,55 +487,75 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         - Unique users
         - Average completion time
         - Submissions by date (last 30 days)
+
+        Responses carry an ETag and are cached for STATS_CACHE_TIMEOUT
+        seconds until the form's submissions change; a matching
+        If-None-Match returns 304.
         """
         form = self.get_form()
         queryset = FormSubmission.objects.filter(form=form)
 
-        # Basic counts
-        total = queryset.count()
-        by_status = queryset.values('status').annotate(count=Count('id'))
-
-        status_counts = {
-            'submitted': 0,
-            'draft': 0,
-            'archived': 0
-        }
-        for item in by_status:
-            status_counts[item['status']] = item['count']
-
-        # Unique users
-        unique_users = queryset.filter(user__isnull=False).values('user').distinct().count()
-        anonymous = queryset.filter(user__isnull=True).count()
-
-        # Average completion time (draft created_at to submitted_at)
-        avg_time = None
-        completed = queryset.filter(
-            status='submitted',
-            submitted_at__isnull=False
+        # Cheap fingerprint of the form's submissions: every column it reads
+        # is in sub_form_created_idx, so it can run as an index-only scan. New,
+        # deleted and re-statused submissions all change it.
+        version = queryset.aggregate(
+            total=Count('*'),
+            submitted=Count('status', filter=Q(status='submitted')),
+            archived=Count('status', filter=Q(status='archived')),
+            latest=Max('created_at'),
         )
+        latest = version['latest'].timestamp() if version['latest'] else 0
+        # The date is part of the key because submissions_by_date is a
+        # rolling 30 day window
+        cache_key = (
+            f"submission_stats:{form.id}:{timezone.localdate()}:{version['total']}:"
+            f"{version['submitted']}:{version['archived']}:{latest}"
+        )
+        etag = quote_etag(hashlib.md5(cache_key.encode()).hexdigest())
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = self._compute_statistics(queryset)
+            cache.set(cache_key, data, timeout=STATS_CACHE_TIMEOUT)
+
+        return Response(data, headers={'ETag': etag})
+
+    def _compute_statistics(self, queryset):
+        """Run the statistics queries and return the serialized payload"""
+        # All scalar stats in a single aggregate query; the per-status
+        # counts are FILTER clauses on the same scan
+        stats = queryset.aggregate(
+            total=Count('*'),
+            submitted=Count('id', filter=Q(status='submitted')),
+            draft=Count('id', filter=Q(status='draft')),
+            archived=Count('id', filter=Q(status='archived')),
+            unique_users=Count('user', distinct=True),
+            anonymous=Count('id', filter=Q(user__isnull=True)),
+            first=Min('created_at'),
+            last=Max('created_at'),
+            # Average completion time (draft created_at to submitted_at)
+            avg_delta=Avg(
+                F('submitted_at') - F('created_at'),
+                filter=Q(status='submitted', submitted_at__isnull=False)
+            ),
+        )
+        avg_delta = stats['avg_delta']
+        avg_time = avg_delta.total_seconds() / 60 if avg_delta else None  # in minutes
 
-        if completed.exists():
-            times = []
-            for sub in completed:
-                if sub.submitted_at and sub.created_at:
-                    delta = (sub.submitted_at - sub.created_at).total_seconds()
-                    times.append(delta)
-
-            if times:
-                avg_time = sum(times) / len(times) / 60  # in minutes
-
-        # First and last submission
-        first = queryset.order_by('created_at').first()
-        last = queryset.order_by('-created_at').first()
-
-        # Submissions by date (last 30 days)
+        # Submissions by date (last 30 days). COUNT(*) needs no column beyond
+        # form_id and created_at, so this is an index-only range scan on
+        # sub_form_created_idx rather than a heap read per row.
         thirty_days_ago = timezone.now() - timedelta(days=30)
         by_date = queryset.filter(
             created_at__gte=thirty_days_ago
         ).annotate(
             date=TruncDate('created_at')
         ).values('date').annotate(
-            count=Count('id')
+            count=Count('*')
         ).order_by('date')
 
         submissions_by_date = {
@@ -260,20 +563,19 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         }
 
         data = {
-            'total_submissions': total,
-            'submitted_count': status_counts['submitted'],
-            'draft_count': status_counts['draft'],
-            'archived_count': status_counts['archived'],
-            'unique_users': unique_users,
-            'anonymous_count': anonymous,
+            'total_submissions': stats['total'],
+            'submitted_count': stats['submitted'],
+            'draft_count': stats['draft'],
+            'archived_count': stats['archived'],
+            'unique_users': stats['unique_users'],
+            'anonymous_count': stats['anonymous'],
             'average_completion_time': avg_time,
-            'first_submission': first.created_at if first else None,
-            'last_submission': last.created_at if last else None,
+            'first_submission': stats['first'],
+            'last_submission': stats['last'],
             'submissions_by_date': submissions_by_date
         }
 
-        serializer = SubmissionStatsSerializer(data)
-        return Response(serializer.data)
+        return dict(SubmissionStatsSerializer(data).data)
 
     @extend_schema(
         tags=['Submissions'],
@@ -322,7 +624,7 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         if date_to:
             queryset = queryset.filter(submitted_at__lte=date_to)
 
-        queryset = queryset.prefetch_related('answers__field').order_by('created_at')
+        queryset = queryset.order_by('created_at')
 
         # Export based on format
         if export_format == 'csv':
@@ -333,65 +635,115 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
             return self._export_excel(form, queryset)
 
     def _export_csv(self, form, submissions):
-        """Export to CSV"""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="{form.unique_slug}_submissions.csv"'
+        """Export to CSV, streamed row by row"""
+        writer = csv.writer(Echo())
 
-        writer = csv.writer(response)
+        field_ids, labels = self._export_columns(form)
 
-        # Get all fields
-        fields = form.fields.all().order_by('order_index')
+        def rows():
+            # Header row
+            header = ['Submission ID', 'User', 'Status', 'Submitted At']
+            header.extend(labels)
+            yield writer.writerow(header)
 
-        # Header row
-        header = ['Submission ID', 'User', 'Status', 'Submitted At']
-        header.extend([f.label for f in fields])
-        writer.writerow(header)
+            # Data rows
+            for row in self._iter_export_rows(field_ids, submissions):
+                yield writer.writerow(row)
 
-        # Data rows
-        for sub in submissions:
-            row = [
-                str(sub.id),
-                sub.user.email if sub.user else 'Anonymous',
-                sub.status,
-                sub.submitted_at.isoformat() if sub.submitted_at else ''
-            ]
-
-            # Get answers for this submission
-            answers_dict = {
-                ans.field_id: self._get_answer_value(ans)
-                for ans in sub.answers.all()
-            }
+        response = ExportStreamingResponse(rows(), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="{form.unique_slug}_submissions.csv"'
+        return response
 
-            # Add answer for each field (in order)
-            for field in fields:
-                row.append(answers_dict.get(field.id, ''))
+    def _export_columns(self, form):
+        """Return the form's field ids and labels in column order"""
+        columns = list(form.fields.order_by('order_index').values_list('id', 'label'))
+        return [field_id for field_id, _ in columns], [label for _, label in columns]
 
-            writer.writerow(row)
+    def _iter_export_rows(self, field_ids, submissions):
+        """
+        Yield one flat row per submission for tabular exports
 
-        return response
+        Submission columns are read with values_list() in chunks, already
+        rendered as text by PostgreSQL; each chunk's answers come from a
+        single values_list() query pivoted into {submission_id: {field_id: value}},
+        so no model instances are built and Python formats no UUIDs or dates.
+        """
+        headers = submissions.values_list(
+            'id',
+            Cast('id', TextField()),
+            Coalesce('user__email', Value('Anonymous'), output_field=TextField()),
+            'status',
+            Coalesce(SUBMITTED_AT_EXPORT_VALUE, Value(''), output_field=TextField()),
+        )
+
+        # Answers are pivoted inline on this connection; a worker thread
+        # would need a second connection and read a different snapshot
+        for batch in self._iter_batches(headers):
+            yield from self._export_rows_for_batch(field_ids, batch, self._pivot_answers(batch))
+
+    def _iter_batches(self, queryset):
+        """Yield lists of up to EXPORT_CHUNK_SIZE rows from a streamed queryset"""
+        batch = []
+        for row in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            batch.append(row)
+            if len(batch) == EXPORT_CHUNK_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _export_answers(self, submission_ids):
+        """Yield (submission_id, field_id, export text) for the given submissions"""
+        answers = SubmissionAnswer.objects.filter(
+            submission_id__in=submission_ids
+        ).annotate(
+            export_value=ANSWER_EXPORT_VALUE
+        ).values_list('submission_id', 'field_id', 'export_value', 'date_value', 'array_value', 'file_url')
+
+        for submission_id, field_id, *values in answers:
+            yield submission_id, field_id, self._format_answer_value(*values)
+
+    def _pivot_answers(self, batch):
+        """Map {submission_id: {field_id: export text}} for a batch of header rows"""
+        pivot = defaultdict(dict)
+        for submission_id, field_id, value in self._export_answers([header[0] for header in batch]):
+            pivot[submission_id][field_id] = value
+        return pivot
+
+    def _export_rows_for_batch(self, field_ids, batch, pivot):
+        for submission_id, *row in batch:
+            answers_dict = pivot.get(submission_id, {})
+            # Add answer for each field (in order)
+            row.extend(answers_dict.get(field_id, '') for field_id in field_ids)
+            yield row
 
     def _export_json(self, form, submissions):
-        """Export to JSON"""
-        data = []
-
-        for sub in submissions:
-            answers = {}
-            for ans in sub.answers.all():
-                answers[ans.field.label] = self._get_answer_value(ans)
-
-            data.append({
-                'id': str(sub.id),
-                'user': sub.user.email if sub.user else 'Anonymous',
-                'status': sub.status,
-                'submitted_at': sub.submitted_at.isoformat() if sub.submitted_at else None,
-                'answers': answers,
-                'metadata': sub.metadata
-            })
-
-        response = HttpResponse(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            content_type='application/json'
-        )
+        """Export to JSON, streamed one orjson-encoded submission at a time"""
+        # Labels come from the form's own fields, so answers need no field join
+        labels = dict(form.fields.values_list('id', 'label'))
+        headers = submissions.values('id', 'user__email', 'status', 'submitted_at', 'metadata')
+
+        def records():
+            separator = b'['
+            for batch in self._iter_batches(headers):
+                pivot = defaultdict(dict)
+                for submission_id, field_id, value in self._export_answers([h['id'] for h in batch]):
+                    pivot[submission_id][labels[field_id]] = value
+
+                for header in batch:
+                    # orjson encodes the UUID and datetime values natively
+                    yield separator + orjson.dumps({
+                        'id': header['id'],
+                        'user': header['user__email'] or 'Anonymous',
+                        'status': header['status'],
+                        'submitted_at': header['submitted_at'],
+                        'answers': pivot.get(header['id'], {}),
+                        'metadata': header['metadata']
+                    })
+                    separator = b','
+            yield b'[]' if separator == b'[' else b']'
+
+        response = ExportStreamingResponse(records(), content_type='application/json')
         response['Content-Disposition'] = f'attachment; filename="{form.unique_slug}_submissions.json"'
 
         return response
@@ -400,66 +752,49 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         """Export to Excel - requires openpyxl"""
         try:
             from openpyxl import Workbook
-            from openpyxl.utils import get_column_letter
         except ImportError:
             return Response({
                 'error': 'Excel export requires openpyxl package'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Submissions"
+        # Write-only mode streams rows to disk instead of building a cell
+        # object for every value, keeping memory flat for large forms.
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Submissions")
 
-        # Get all fields
-        fields = form.fields.all().order_by('order_index')
+        field_ids, labels = self._export_columns(form)
 
         # Header row
         headers = ['Submission ID', 'User', 'Status', 'Submitted At']
-        headers.extend([f.label for f in fields])
+        headers.extend(labels)
         ws.append(headers)
 
         # Data rows
-        for sub in submissions:
-            row = [
-                str(sub.id),
-                sub.user.email if sub.user else 'Anonymous',
-                sub.status,
-                sub.submitted_at.isoformat() if sub.submitted_at else ''
-            ]
-
-            answers_dict = {
-                ans.field_id: self._get_answer_value(ans)
-                for ans in sub.answers.all()
-            }
-
-            for field in fields:
-                row.append(answers_dict.get(field.id, ''))
-
+        for row in self._iter_export_rows(field_ids, submissions):
             ws.append(row)
 
-        # Save to response
-        response = HttpResponse(
+        # Save to a temporary file, removed once the response is closed
+        output = tempfile.TemporaryFile()
+        wb.save(output)
+        output.seek(0)
+
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename=f'{form.unique_slug}_submissions.xlsx',
             content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
         )
-        response['Content-Disposition'] = f'attachment; filename="{form.unique_slug}_submissions.xlsx"'
-        wb.save(response)
-
-        return response
 
-    def _get_answer_value(self, answer):
-        """Extract appropriate value from answer based on field type"""
-        if answer.text_value:
-            return answer.text_value
-        elif answer.numeric_value is not None:
-            return str(answer.numeric_value)
-        elif answer.boolean_value is not None:
-            return 'Yes' if answer.boolean_value else 'No'
-        elif answer.date_value:
-            return answer.date_value.isoformat()
-        elif answer.array_value:
-            return ', '.join(answer.array_value) if isinstance(answer.array_value, list) else str(answer.array_value)
-        elif answer.file_url:
-            return answer.file_url
+    def _format_answer_value(self, export_value, date_value, array_value, file_url):
+        """Finish an answer's export text where SQL left ANSWER_EXPORT_VALUE NULL"""
+        if export_value is not None:
+            return export_value
+        elif date_value:
+            return date_value.isoformat()
+        elif array_value:
+            return ', '.join(array_value) if isinstance(array_value, list) else str(array_value)
+        elif file_url:
+            return file_url
         return ''
 
     @extend_schema(
@@ -492,13 +827,26 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         )
         serializer.is_valid(raise_exception=True)
 
-        submission_ids = serializer.validated_data['submission_ids']
+        # Validation already checked these ids belong to the form
+        submission_ids = serializer.context['existing_ids']
 
-        # Delete
-        deleted_count = FormSubmission.objects.filter(
-            id__in=submission_ids,
-            form=form
-        ).delete()[0]
+        with transaction.atomic():
+            # Answers go first in one DELETE, skipping the collector entirely
+            # when nothing listens for their delete signals
+            answers = SubmissionAnswer.objects.filter(
+                submission_id__in=submission_ids
+            )
+            if (pre_delete.has_listeners(SubmissionAnswer)
+                    or post_delete.has_listeners(SubmissionAnswer)):
+                answers.delete()
+            else:
+                answers._raw_delete(answers.db)
+
+            deleted_count = FormSubmission.objects.filter(
+                id__in=submission_ids,
+                form=form
+            ).delete()[1].get(FormSubmission._meta.label, 0)
+            self._decrement_submission_count(form.pk, deleted_count)
 
         return Response({
             'message': f'{deleted_count} submissions deleted successfully',
@@ -539,7 +887,7 @@ class SubmissionManagementViewSet(viewsets.GenericViewSet):
         queryset = FormSubmission.objects.filter(
             id__in=submission_ids,
             form=form
-        ).prefetch_related('answers__field').order_by('created_at')
+        ).order_by('created_at')
 
         # Export
         if export_format == 'csv':
@@ -0,0 +1,71 @@
+"""
+Coalesce live report events into one channel-layer message per group.
+
+Submissions arriving close together are buffered per group and sent as
+a single "batch" report update, either after FLUSH_INTERVAL seconds or
+as soon as a group holds MAX_BUFFERED_EVENTS events.
+"""
+import logging
+import threading
+from collections import defaultdict
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds events wait for company before the buffer is flushed
+FLUSH_INTERVAL = 0.05
+
+# Events per group that force an immediate flush
+MAX_BUFFERED_EVENTS = 100
+
+_buffers = defaultdict(list)
+_lock = threading.Lock()
+_timer = None
+
+
+def enqueue(group_name, message):
+    """Buffer a report update message for the given group"""
+    global _timer
+    ready = None
+    with _lock:
+        events = _buffers[group_name]
+        events.append(message)
+        if len(events) >= MAX_BUFFERED_EVENTS:
+            ready = _buffers.pop(group_name)
+        elif _timer is None:
+            _timer = threading.Timer(FLUSH_INTERVAL, flush)
+            _timer.daemon = True
+            _timer.start()
+    if ready:
+        _send(group_name, ready)
+
+
+def flush():
+    """Send every buffered group now"""
+    global _timer
+    with _lock:
+        pending = dict(_buffers)
+        _buffers.clear()
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+    for group_name, events in pending.items():
+        _send(group_name, events)
+
+
+def _send(group_name, events):
+    # A lone event keeps the original message shape for existing clients
+    if len(events) == 1:
+        message = events[0]
+    else:
+        message = {'status': 'batch', 'events': events}
+    try:
+        async_to_sync(get_channel_layer().group_send)(
+            group_name,
+            {'type': 'report.update', 'message': message}
+        )
+    except Exception as e:
+        logger.error(f"Error sending WebSocket signal: {e}")
@@ -1,9 +1,122 @@
 from rest_framework import serializers
+from drf_spectacular.utils import extend_schema_field
 from submissions.models import FormSubmission, SubmissionAnswer
 from forms.models import Form, FormField, FieldOption
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
-import uuid
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from uuid import uuid4
+
+from shared.utils import session_uuid
+
+
+# Answers inserted per statement when saving a submission
+ANSWER_BATCH_SIZE = 500
+
+# Columns that hold an answer's value
+ANSWER_VALUE_COLUMNS = (
+    'text_value', 'numeric_value', 'boolean_value',
+    'date_value', 'array_value', 'file_url',
+)
+
+# Columns of the public form payload read by FormPublicSerializer
+PUBLIC_FIELD_COLUMNS = (
+    'id', 'field_type', 'label', 'description',
+    'is_required', 'order_index', 'validation_rules', 'settings',
+)
+PUBLIC_OPTION_COLUMNS = (
+    'options__id', 'options__label', 'options__value', 'options__order_index',
+)
+
+# Answer column that holds the value for each field type
+ANSWER_VALUE_FIELDS = {
+    'text': 'text_value',
+    'textarea': 'text_value',
+    'email': 'text_value',
+    'number': 'numeric_value',
+    'date': 'date_value',
+    'checkbox': 'array_value',
+    'select': 'text_value',
+    'radio': 'text_value',
+    'file': 'file_url',
+}
+
+# Field types checked against min_length/max_length rules
+LENGTH_RULE_FIELD_TYPES = frozenset({'text', 'textarea'})
+
+# Per field type: the answer column, how to measure it, and the
+# (rule, is_upper_bound, message) checks applied in order
+FIELD_RULE_CHECKS = {
+    **{
+        field_type: ('text_value', len, (
+            ('min_length', False, "Minimum length is {}"),
+            ('max_length', True, "Maximum length is {}"),
+        ))
+        for field_type in LENGTH_RULE_FIELD_TYPES
+    },
+    'number': ('numeric_value', None, (
+        ('min_value', False, "Minimum value is {}"),
+        ('max_value', True, "Maximum value is {}"),
+    )),
+    'checkbox': ('array_value', len, (
+        ('min_selections', False, "Select at least {} options"),
+        ('max_selections', True, "Select at most {} options"),
+    )),
+}
+
+
+def _build_rule_checker(field_type, limits):
+    """
+    Build a validator for one field type with its rule limits bound in
+
+    limits lines up with the field type's FIELD_RULE_CHECKS entries; None
+    means the rule is not set. Returns None when no rule applies.
+    """
+    column, measure, checks = FIELD_RULE_CHECKS[field_type]
+    bound = tuple(
+        (limit, is_upper, {column: message.format(limit)})
+        for (_, is_upper, message), limit in zip(checks, limits)
+        if limit is not None
+    )
+    if not bound:
+        return None
+
+    def check(data):
+        value = data.get(column)
+        if value is None:
+            return
+        if measure is not None:
+            value = measure(value)
+        for limit, is_upper, error in bound:
+            if (value > limit) if is_upper else (value < limit):
+                raise serializers.ValidationError(error)
+
+    return check
+
+
+_cached_rule_checker = lru_cache(maxsize=1024)(_build_rule_checker)
+
+
+def compile_field_validator(field):
+    """
+    Return a callable applying the field's validation_rules to an answer
+
+    Fields with the same type and limits share one validator. Returns None
+    when the field has no rules to check.
+    """
+    entry = FIELD_RULE_CHECKS.get(field.field_type)
+    rules = field.validation_rules
+    if entry is None or not rules:
+        return None
+    limits = tuple(rules.get(rule) for rule, _, _ in entry[2])
+    try:
+        return _cached_rule_checker(field.field_type, limits)
+    except TypeError:
+        # Unhashable limit; build it without caching
+        return _build_rule_checker(field.field_type, limits)
 
 
 class FieldOptionPublicSerializer(serializers.ModelSerializer):
@@ -32,7 +145,7 @@ class FormPublicSerializer(serializers.ModelSerializer):
     Public serializer for form structure
     Used when users want to view/fill a form
     """
-    fields = FormFieldPublicSerializer(many=True, read_only=True)
+    fields = serializers.SerializerMethodField(method_name='get_form_fields')
     is_password_protected = serializers.SerializerMethodField()
 
     class Meta:
@@ -42,6 +155,57 @@ class FormPublicSerializer(serializers.ModelSerializer):
             'is_password_protected', 'fields', 'settings'
         ]
 
+    @classmethod
+    def eager_loading_prefetches(cls):
+        """Prefetches for the fields and options this serializer nests, in display order"""
+        options = FieldOption.objects.only(
+            'id', 'field', 'label', 'value', 'order_index'
+        ).order_by('order_index')
+        fields = FormField.objects.only(
+            'form', *PUBLIC_FIELD_COLUMNS
+        ).order_by('order_index').prefetch_related(
+            Prefetch('options', queryset=options)
+        )
+        return [Prefetch('fields', queryset=fields)]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the fields and options this serializer nests"""
+        return queryset.prefetch_related(*cls.eager_loading_prefetches())
+
+    @extend_schema_field(FormFieldPublicSerializer(many=True))
+    def get_form_fields(self, obj):
+        """
+        Fields with their options, in display order
+
+        Uses prefetched fields when the caller loaded them; otherwise reads
+        fields and options in one LEFT JOIN and groups the rows in Python.
+        """
+        if 'fields' in getattr(obj, '_prefetched_objects_cache', {}):
+            return FormFieldPublicSerializer(obj.fields.all(), many=True).data
+
+        rows = FormField.objects.filter(form=obj).order_by(
+            'order_index', 'id', 'options__order_index'
+        ).values_list(*PUBLIC_FIELD_COLUMNS, *PUBLIC_OPTION_COLUMNS)
+
+        fields = []
+        width = len(PUBLIC_FIELD_COLUMNS)
+        for _, group in groupby(rows, key=itemgetter(0)):
+            group = list(group)
+            field = dict(zip(PUBLIC_FIELD_COLUMNS, group[0][:width]))
+            field['id'] = str(field['id'])
+            field['options'] = [
+                {
+                    'id': str(row[width]),
+                    'label': row[width + 1],
+                    'value': row[width + 2],
+                    'order_index': row[width + 3],
+                }
+                for row in group if row[width] is not None
+            ]
+            fields.append(field)
+        return fields
+
     def get_is_password_protected(self, obj) -> bool:
         """Check if form requires password"""
         return obj.visibility == 'private' and bool(obj.access_password)
@@ -53,8 +217,6 @@ class FormPasswordVerifySerializer(serializers.Serializer):
 
     def validate_password(self, value):
         """Validate password against form"""
-        from django.contrib.auth.hashers import check_password
-        
         form = self.context.get('form')
         if not form:
             raise serializers.ValidationError("Form not found")
@@ -65,7 +227,9 @@ class FormPasswordVerifySerializer(serializers.Serializer):
         if not form.access_password:
             raise serializers.ValidationError("This form has no password set")
 
-        if not check_password(value, form.access_password):
+        # Verify with the form's own hasher instead of re-identifying it per call
+        hasher = form.password_hasher
+        if hasher is None or not hasher.verify(value, form.access_password):
             raise serializers.ValidationError("Incorrect password")
 
         return value
@@ -93,31 +257,32 @@ class SubmissionAnswerSerializer(serializers.ModelSerializer):
         """Validate answer based on field type and validation rules"""
         field_id = data.get('field_id')
 
-        try:
-            field = FormField.objects.get(id=field_id)
-        except FormField.DoesNotExist:
-            raise serializers.ValidationError({'field_id': 'Field not found'})
+        # FormSubmissionSerializer loads the form's fields once and shares them
+        fields_by_id = self.context.get('fields_by_id')
+        if fields_by_id is not None:
+            field = fields_by_id.get(field_id)
+            if field is None:
+                # Not on this form; FormSubmissionSerializer.validate rejects it
+                return data
+        else:
+            try:
+                field = FormField.objects.get(id=field_id)
+            except FormField.DoesNotExist:
+                raise serializers.ValidationError({'field_id': 'Field not found'})
 
         # Check which value field should be filled based on field_type
         field_type = field.field_type
-        value_fields = {
-            'text': 'text_value',
-            'textarea': 'text_value',
-            'email': 'text_value',
-            'number': 'numeric_value',
-            'date': 'date_value',
-            'checkbox': 'array_value',
-            'select': 'text_value',
-            'radio': 'text_value',
-            'file': 'file_url',
-        }
-
-        expected_field = value_fields.get(field_type)
+        expected_field = ANSWER_VALUE_FIELDS.get(field_type)
         if not expected_field:
             raise serializers.ValidationError(
                 f"Unsupported field type: {field_type}"
             )
 
+        # Drafts may hold partial answers; values and rules are only
+        # enforced on final submissions
+        if not self.context.get('is_final', True):
+            return data
+
         # Check if correct value field is provided
         if not data.get(expected_field):
             raise serializers.ValidationError({
@@ -131,45 +296,21 @@ class SubmissionAnswerSerializer(serializers.ModelSerializer):
 
     def _validate_field_rules(self, field, data):
         """Apply field-specific validation rules"""
-        rules = field.validation_rules or {}
-        field_type = field.field_type
+        validators_by_id = self.context.get('validators_by_id')
+        if validators_by_id is not None and field.id in validators_by_id:
+            validator = validators_by_id[field.id]
+        else:
+            validator = compile_field_validator(field)
+        if validator is not None:
+            validator(data)
 
-        # Text/Textarea validation
-        if field_type in ['text', 'textarea']:
-            text = data.get('text_value', '')
-            if 'min_length' in rules and len(text) < rules['min_length']:
-                raise serializers.ValidationError({
-                    'text_value': f"Minimum length is {rules['min_length']}"
-                })
-            if 'max_length' in rules and len(text) > rules['max_length']:
-                raise serializers.ValidationError({
-                    'text_value': f"Maximum length is {rules['max_length']}"
-                })
 
-        # Number validation
-        elif field_type == 'number':
-            num = data.get('numeric_value')
-            if num is not None:
-                if 'min_value' in rules and num < rules['min_value']:
-                    raise serializers.ValidationError({
-                        'numeric_value': f"Minimum value is {rules['min_value']}"
-                    })
-                if 'max_value' in rules and num > rules['max_value']:
-                    raise serializers.ValidationError({
-                        'numeric_value': f"Maximum value is {rules['max_value']}"
-                    })
-
-        # Checkbox validation
-        elif field_type == 'checkbox':
-            selections = data.get('array_value', [])
-            if 'min_selections' in rules and len(selections) < rules['min_selections']:
-                raise serializers.ValidationError({
-                    'array_value': f"Select at least {rules['min_selections']} options"
-                })
-            if 'max_selections' in rules and len(selections) > rules['max_selections']:
-                raise serializers.ValidationError({
-                    'array_value': f"Select at most {rules['max_selections']} options"
-                })
+@extend_schema_field(serializers.UUIDField())
+class SessionIdField(serializers.CharField):
+    """Session id that also accepts the pre-UUID ids clients may still hold"""
+
+    def to_internal_value(self, data):
+        return session_uuid(super().to_internal_value(data))
 
 
 class FormSubmissionSerializer(serializers.ModelSerializer):
@@ -179,6 +320,7 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
     """
     answers = SubmissionAnswerSerializer(many=True, required=True)
     form_slug = serializers.SlugField(write_only=True)
+    session_id = SessionIdField(required=False)
 
     class Meta:
         model = FormSubmission
@@ -189,43 +331,71 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'submitted_at', 'created_at', 'updated_at']
 
-    def validate(self, data):
-        """Validate submission"""
-        form_slug = data.get('form_slug')
-        answers = data.get('answers', [])
+    def validate_form_slug(self, value):
+        """
+        Load the form and its fields once
 
-        # Get form
+        form_slug is validated before answers, so the answer serializers
+        find the fields in the shared context instead of querying per answer.
+        """
         try:
-            form = Form.objects.prefetch_related('fields').get(
-                unique_slug=form_slug,
+            # Only the columns validation and create() read
+            form = Form.objects.only(
+                'id', 'unique_slug', 'visibility', 'is_active'
+            ).prefetch_related(Prefetch(
+                'fields',
+                queryset=FormField.objects.only(
+                    'id', 'form', 'field_type', 'label', 'is_required', 'validation_rules'
+                )
+            )).get(
+                unique_slug=value,
                 is_active=True
             )
         except Form.DoesNotExist:
-            raise serializers.ValidationError({'form_slug': 'Form not found'})
+            raise serializers.ValidationError('Form not found')
 
         # Store form for create method
         self.context['form'] = form
+        self.context['fields_by_id'] = {field.id: field for field in form.fields.all()}
+        self.context['validators_by_id'] = {
+            field.id: compile_field_validator(field) for field in form.fields.all()
+        }
+        # Answers are validated before validate() sees the status
+        self.context['is_final'] = self.initial_data.get('status') == 'submitted'
+        return value
 
-        # Check if it's a final submission (not draft)
-        if data.get('status') == 'submitted':
-            # Validate all required fields are answered
-            required_fields = form.fields.filter(is_required=True)
-            answered_field_ids = [ans['field_id'] for ans in answers]
+    def validate(self, data):
+        """Validate submission"""
+        answers = data.get('answers', [])
+        fields_by_id = self.context.get('fields_by_id')
+        if fields_by_id is None:
+            raise serializers.ValidationError({'form_slug': 'Form not found'})
 
-            for req_field in required_fields:
-                if req_field.id not in answered_field_ids:
-                    raise serializers.ValidationError({
-                        'answers': f"Required field '{req_field.label}' is missing"
-                    })
+        answered_field_ids = {ans['field_id'] for ans in answers}
+        if len(answered_field_ids) != len(answers):
+            raise serializers.ValidationError({
+                'answers': 'Each field can only be answered once'
+            })
 
-        # Validate all answers belong to this form
-        form_field_ids = list(form.fields.values_list('id', flat=True))
-        for answer in answers:
-            if answer['field_id'] not in form_field_ids:
+        # Check if it's a final submission (not draft)
+        if data.get('status') == 'submitted':
+            # Validate all required fields are answered, reporting every gap
+            missing = [
+                field.label for field in fields_by_id.values()
+                if field.is_required and field.id not in answered_field_ids
+            ]
+            if missing:
                 raise serializers.ValidationError({
-                    'answers': f"Field {answer['field_id']} does not belong to this form"
+                    'answers': f"Required fields missing: {', '.join(missing)}"
                 })
 
+        # Validate all answers belong to this form
+        unknown = answered_field_ids - fields_by_id.keys()
+        if unknown:
+            raise serializers.ValidationError({
+                'answers': f"Fields {', '.join(sorted(map(str, unknown)))} do not belong to this form"
+            })
+
         return data
 
     @transaction.atomic
@@ -237,7 +407,7 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
 
         # Generate session_id if not provided
         if 'session_id' not in validated_data:
-            validated_data['session_id'] = str(uuid.uuid4())
+            validated_data['session_id'] = uuid4()
 
         # Set submitted_at for final submissions
         if validated_data.get('status') == 'submitted':
@@ -254,14 +424,11 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
             **validated_data
         )
 
-        # Create answers
-        for answer_data in answers_data:
-            field_id = answer_data.pop('field_id')
-            SubmissionAnswer.objects.create(
-                submission=submission,
-                field_id=field_id,
-                **answer_data
-            )
+        # Create answers in one INSERT
+        SubmissionAnswer.objects.bulk_create(
+            self._build_answers(submission, answers_data),
+            batch_size=ANSWER_BATCH_SIZE
+        )
 
         return submission
 
@@ -283,20 +450,66 @@ class FormSubmissionSerializer(serializers.ModelSerializer):
 
         # Update answers if provided
         if answers_data is not None:
-            # Delete old answers
-            instance.answers.all().delete()
-
-            # Create new answers
-            for answer_data in answers_data:
-                field_id = answer_data.pop('field_id')
-                SubmissionAnswer.objects.create(
-                    submission=instance,
-                    field_id=field_id,
-                    **answer_data
-                )
+            self._sync_answers(instance, answers_data)
 
         return instance
 
+    def _sync_answers(self, submission, answers_data):
+        """
+        Make the submission's answers match answers_data
+
+        Incoming answers reuse the stored rows for the same field, so only
+        changed values are written, new fields inserted and dropped fields
+        deleted.
+        """
+        # answer_submission_field_uniq guarantees one stored answer per field
+        existing = {answer.field_id: answer for answer in submission.answers.all()}
+
+        to_update = []
+        to_create = []
+        for answer_data in answers_data:
+            answer = existing.pop(answer_data['field_id'], None)
+            if answer is None:
+                to_create.append(answer_data)
+                continue
+            changed = False
+            for column in ANSWER_VALUE_COLUMNS:
+                value = answer_data.get(column)
+                if getattr(answer, column) != value:
+                    setattr(answer, column, value)
+                    changed = True
+            if changed:
+                to_update.append(answer)
+
+        stale_ids = [answer.id for answer in existing.values()]
+        if stale_ids:
+            SubmissionAnswer.objects.filter(id__in=stale_ids).delete()
+        if to_update:
+            SubmissionAnswer.objects.bulk_update(
+                to_update, ANSWER_VALUE_COLUMNS, batch_size=ANSWER_BATCH_SIZE
+            )
+        if to_create:
+            SubmissionAnswer.objects.bulk_create(
+                self._build_answers(submission, to_create),
+                batch_size=ANSWER_BATCH_SIZE
+            )
+
+    def _build_answers(self, submission, answers_data):
+        """Build unsaved SubmissionAnswer rows for bulk_create"""
+        return [
+            SubmissionAnswer(
+                submission=submission,
+                field_id=answer_data['field_id'],
+                text_value=answer_data.get('text_value'),
+                numeric_value=answer_data.get('numeric_value'),
+                boolean_value=answer_data.get('boolean_value'),
+                date_value=answer_data.get('date_value'),
+                array_value=answer_data.get('array_value'),
+                file_url=answer_data.get('file_url'),
+            )
+            for answer_data in answers_data
+        ]
+
 
 class FormSubmissionReadSerializer(serializers.ModelSerializer):
     """Read-only serializer for viewing submissions"""
@@ -312,6 +525,21 @@ class FormSubmissionReadSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the form, user and answers this serializer reads"""
+        return queryset.select_related('form', 'user').prefetch_related('answers')
+
+
+class FormSubmissionListSerializer(FormSubmissionReadSerializer):
+    """Summary serializer for submission list pages (omits metadata)"""
+
+    class Meta(FormSubmissionReadSerializer.Meta):
+        fields = [
+            'id', 'form_title', 'user_email', 'session_id', 'status',
+            'answers', 'submitted_at', 'created_at', 'updated_at'
+        ]
+
 
 class SubmissionAnswerDetailSerializer(serializers.ModelSerializer):
     """Detailed answer with field info"""
@@ -342,6 +570,13 @@ class FormSubmissionDetailSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the form, user, answers and each answer's field this serializer reads"""
+        return queryset.select_related('form', 'user').prefetch_related(
+            Prefetch('answers', queryset=SubmissionAnswer.objects.select_related('field'))
+        )
+
     def get_user_name(self, obj) -> str:
         """Get user full name or email"""
         if obj.user:
@@ -375,16 +610,19 @@ class BulkDeleteSerializer(serializers.Serializer):
         """Check if all submissions exist"""
         form = self.context.get('form')
 
-        existing = FormSubmission.objects.filter(
+        existing_ids = set(FormSubmission.objects.filter(
             id__in=value,
             form=form
-        ).count()
+        ).values_list('id', flat=True))
 
-        if existing != len(value):
+        missing = set(value) - existing_ids
+        if missing:
             raise serializers.ValidationError(
-                "Some submissions do not exist or don't belong to this form"
+                f"Submissions not found: {', '.join(sorted(str(pk) for pk in missing))}"
             )
 
+        # The view deletes exactly these rows without looking them up again
+        self.context['existing_ids'] = existing_ids
         return value
 
 
@@ -0,0 +1,24 @@
+"""
+Keep Form.submission_count in step with the form's submissions.
+
+Only creates are counted here. A post_delete receiver would make every
+QuerySet.delete() of submissions load the rows and update the form once
+per row, so the views that delete submissions (owner destroy and
+bulk_delete) decrement the counter themselves. Deleting a form takes its
+counter with it.
+"""
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from forms.models import Form
+from submissions.models import FormSubmission
+
+
+@receiver(post_save, sender=FormSubmission)
+def increment_submission_count(sender, instance, created, **kwargs):
+    if created:
+        Form.objects.filter(pk=instance.form_id).update(
+            submission_count=F('submission_count') + 1
+        )
+
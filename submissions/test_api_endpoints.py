@@ -1,19 +1,35 @@
 import uuid
+import json
+import warnings
+from unittest import mock
+from asgiref.sync import async_to_sync
 from decimal import Decimal
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APIRequestFactory
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.tokens import AccessToken
 from django.utils import timezone
+from datetime import timedelta
 from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from submissions import realtime
 from submissions.models import FormSubmission, SubmissionAnswer
+from submissions.owner_views import SubmissionManagementViewSet
+from submissions.serializers import FormPublicSerializer, FormSubmissionListSerializer, FormSubmissionSerializer
 from forms.models import Form, FormField, FieldOption
+from analytics import buffered_writer
 from analytics.models import FormView
 
 User = get_user_model()
 
+# Hashed once per process and shared by every user fixture
+TEST_PASSWORD_HASH = make_password('testpass123')
+
 
 # ============================================================================
 # PUBLIC FORM API TESTS
@@ -24,11 +40,12 @@ class PublicFormAPITestCase(APITestCase):
 
     def setUp(self):
         """Set up test data"""
-        self.user = User.objects.create_user(
+        self.user = User.objects.create(
             email='owner@example.com',
+            username='owner@example.com',
             first_name='Owner',
             last_name='User',
-            password='testpass123'
+            password=TEST_PASSWORD_HASH
         )
         
         self.public_form = Form.objects.create(
@@ -82,7 +99,7 @@ class PublicFormAPITestCase(APITestCase):
             order_index=2
         )
         
-        self.session_id = 'test-session-123'
+        self.session_id = '0b90c2be-4510-5921-9805-5df5697c4dd9'
         
     def test_get_public_form_success(self):
         """Test getting public form structure"""
@@ -95,10 +112,68 @@ class PublicFormAPITestCase(APITestCase):
         self.assertFalse(response.data['is_password_protected'])
         self.assertEqual(len(response.data['fields']), 3)
         
+    def test_get_public_form_query_count(self):
+        """Test fields and options load in one query each, in display order"""
+        for field in (self.field1, self.field2, self.field3):
+            FieldOption.objects.create(field=field, label='B', value='b', order_index=1)
+            FieldOption.objects.create(field=field, label='A', value='a', order_index=0)
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/'
+        
+        # slug lookup + full form + fields joined with their options
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        
+        self.assertEqual([f['label'] for f in response.data['fields']], ['Full Name', 'Email Address', 'Comments'])
+        self.assertEqual([o['label'] for o in response.data['fields'][0]['options']], ['A', 'B'])
+        
+        prefetched = FormPublicSerializer.setup_eager_loading(
+            Form.objects.filter(pk=self.public_form.pk)
+        ).get()
+        self.assertEqual(
+            JSONRenderer().render(response.data),
+            JSONRenderer().render(FormPublicSerializer(prefetched).data)
+        )
+        
+    def test_get_public_form_cached_until_edited(self):
+        """Test the form structure is served from cache until a field changes"""
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/'
+        first = self.client.get(url)
+        
+        # Slug lookup and structure both come from the cache
+        with self.assertNumQueries(0):
+            cached = self.client.get(url)
+        self.assertEqual(cached.data, first.data)
+        
+        self.field3.label = 'Feedback'
+        self.field3.save()
+        response = self.client.get(url)
+        self.assertEqual(response.data['fields'][2]['label'], 'Feedback')
+        
+        FieldOption.objects.create(field=self.field3, label='A', value='a', order_index=0)
+        response = self.client.get(url)
+        self.assertEqual(len(response.data['fields'][2]['options']), 1)
+        
+    def test_get_public_form_not_modified(self):
+        """Test a matching If-None-Match gets 304 until a field changes"""
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/'
+        etag = self.client.get(url)['ETag']
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        
+        self.field3.label = 'Feedback'
+        self.field3.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        
     def test_get_public_form_private_without_password(self):
         """Test getting private form without password verification"""
         url = f'/api/v1/public/forms/{self.private_form.unique_slug}/'
-        response = self.client.get(url)
+        # Refused on the slug lookup alone, before the structure is read
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertTrue(response.data['requires_password'])
@@ -138,6 +213,7 @@ class PublicFormAPITestCase(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data['access_granted'])
+        self.assertFalse(response.data['already_verified'])
         
     def test_verify_password_invalid(self):
         """Test password verification with wrong password"""
@@ -147,6 +223,63 @@ class PublicFormAPITestCase(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
+    def test_verify_password_locks_out_repeated_failures(self):
+        """Test an address is refused after too many wrong passwords"""
+        from submissions.views import FORM_PASSWORD_MAX_ATTEMPTS
+        
+        url = f'/api/v1/public/forms/{self.private_form.unique_slug}/verify-password/'
+        for _ in range(FORM_PASSWORD_MAX_ATTEMPTS):
+            response = self.client.post(url, {'password': 'wrongpassword'}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        response = self.client.post(url, {'password': 'secret123'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        
+        response = self.client.post(
+            url, {'password': 'secret123'}, format='json', REMOTE_ADDR='10.0.0.2'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_verify_password_lockout_ignores_forwarded_for(self):
+        """Test rotating X-Forwarded-For does not reset the attempt counter"""
+        from submissions.views import FORM_PASSWORD_MAX_ATTEMPTS
+        
+        url = f'/api/v1/public/forms/{self.private_form.unique_slug}/verify-password/'
+        for i in range(FORM_PASSWORD_MAX_ATTEMPTS):
+            self.client.post(
+                url, {'password': 'wrongpassword'}, format='json', HTTP_X_FORWARDED_FOR=f'203.0.113.{i}'
+            )
+        
+        response = self.client.post(
+            url, {'password': 'secret123'}, format='json', HTTP_X_FORWARDED_FOR='203.0.113.250'
+        )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        
+    def test_verify_password_locks_form_after_guesses_from_many_addresses(self):
+        """Test the per-form cap applies across client addresses"""
+        url = f'/api/v1/public/forms/{self.private_form.unique_slug}/verify-password/'
+        with mock.patch('submissions.views.FORM_PASSWORD_MAX_FORM_ATTEMPTS', 3):
+            for i in range(3):
+                self.client.post(
+                    url, {'password': 'wrongpassword'}, format='json', REMOTE_ADDR=f'10.0.1.{i}'
+                )
+            response = self.client.post(
+                url, {'password': 'secret123'}, format='json', REMOTE_ADDR='10.0.1.99'
+            )
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        
+    def test_verify_password_skips_check_once_verified(self):
+        """Test a verified session is not asked for the password again"""
+        url = f'/api/v1/public/forms/{self.private_form.unique_slug}/verify-password/'
+        self.client.post(url, {'password': 'secret123'}, format='json')
+        
+        response = self.client.post(url, {'password': 'wrongpassword'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['access_granted'])
+        self.assertTrue(response.data['already_verified'])
+        self.assertEqual(response.data['message'], 'Access already granted for this session')
+        
     def test_verify_password_public_form(self):
         """Test password verification for public form"""
         url = f'/api/v1/public/forms/{self.public_form.unique_slug}/verify-password/'
@@ -163,9 +296,29 @@ class PublicFormAPITestCase(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
+        # The view is only buffered until the next batch insert
+        self.assertFalse(FormView.objects.filter(form=self.public_form).exists())
+        buffered_writer.flush()
         view = FormView.objects.filter(form=self.public_form, session_id=self.session_id).first()
         self.assertIsNotNone(view)
         
+    def test_track_view_reuses_cached_form_until_saved(self):
+        """Test the slug lookup is cached and dropped when the form is saved"""
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/view/'
+        self.client.post(url, {'session_id': self.session_id}, format='json')
+        
+        # The form comes from the cache and the view is buffered
+        with self.assertNumQueries(0):
+            response = self.client.post(url, {'session_id': self.session_id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        buffered_writer.flush()
+        self.assertEqual(FormView.objects.filter(form=self.public_form).count(), 2)
+        
+        self.public_form.is_active = False
+        self.public_form.save()
+        response = self.client.post(url, {'session_id': self.session_id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        
     def test_submit_form_success(self):
         """Test submitting a form"""
         url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
@@ -196,6 +349,118 @@ class PublicFormAPITestCase(APITestCase):
         self.assertEqual(submission.answers.count(), 3)
         self.assertIsNotNone(submission.submitted_at)
         
+    def test_submit_form_batches_live_report_updates(self):
+        """Test nearby submissions reach the live report as one batch message"""
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
+        answers = [
+            {'field_id': str(self.field1.id), 'text_value': 'John Doe'},
+            {'field_id': str(self.field2.id), 'text_value': 'john@example.com'},
+        ]
+        with mock.patch('submissions.realtime._send') as send:
+            # Events are only queued once the submission commits
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                first = self.client.post(url, {'session_id': str(uuid.uuid4()), 'answers': answers}, format='json')
+                second = self.client.post(url, {'session_id': str(uuid.uuid4()), 'answers': answers}, format='json')
+                realtime.flush()
+                send.assert_not_called()
+            self.assertEqual(len(callbacks), 2)
+            realtime.flush()
+        
+        send.assert_called_once()
+        group_name, events = send.call_args.args
+        self.assertEqual(group_name, f'form_report_{self.public_form.unique_slug}')
+        self.assertEqual(
+            [event['submission_id'] for event in events],
+            [str(first.data['submission_id']), str(second.data['submission_id'])]
+        )
+        
+    def test_submit_form_query_count(self):
+        """Test a submission's queries do not grow with its number of answers"""
+        data = {
+            'form_slug': self.public_form.unique_slug,
+            'session_id': self.session_id,
+            'status': 'submitted',
+            'answers': [
+                {'field_id': str(self.field1.id), 'text_value': 'John Doe'},
+                {'field_id': str(self.field2.id), 'text_value': 'john@example.com'},
+                {'field_id': str(self.field3.id), 'text_value': 'Great form!'},
+            ]
+        }
+        serializer = FormSubmissionSerializer(data=data)
+        
+        # form + prefetched fields
+        with self.assertNumQueries(2):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        
+        # savepoint + submission + form counter + one INSERT for all answers + release
+        with self.assertNumQueries(5):
+            submission = serializer.save()
+        self.assertEqual(submission.answers.count(), 3)
+        
+    def test_submit_form_rejects_field_from_other_form(self):
+        """Test answers for another form's field are rejected"""
+        other_field = FormField.objects.create(
+            form=self.private_form, field_type='text', label='Other', order_index=0
+        )
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
+        data = {
+            'session_id': self.session_id,
+            'answers': [
+                {'field_id': str(self.field1.id), 'text_value': 'John Doe'},
+                {'field_id': str(self.field2.id), 'text_value': 'john@example.com'},
+                {'field_id': str(other_field.id), 'text_value': 'Sneaky'},
+            ]
+        }
+        response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(f'{other_field.id} do not belong to this form', str(response.data['answers']))
+        
+    def test_submit_form_applies_validation_rules(self):
+        """Test field validation rules reject out-of-range answers"""
+        self.field1.validation_rules = {'min_length': 5, 'max_length': 10}
+        self.field1.save()
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
+        for text, message in [('Jo', 'Minimum length is 5'), ('J' * 11, 'Maximum length is 10')]:
+            data = {
+                'session_id': self.session_id,
+                'answers': [
+                    {'field_id': str(self.field1.id), 'text_value': text},
+                    {'field_id': str(self.field2.id), 'text_value': 'john@example.com'},
+                ]
+            }
+            response = self.client.post(url, data, format='json')
+            
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(message, str(response.data['answers']))
+        
+    def test_compiled_validators_shared_across_fields(self):
+        """Test fields with the same type and rules reuse one validator"""
+        from submissions.serializers import compile_field_validator
+        
+        self.field1.validation_rules = {'min_length': 2}
+        self.field2.validation_rules = {}
+        other = FormField(field_type='text', validation_rules={'min_length': 2})
+        
+        self.assertIs(compile_field_validator(self.field1), compile_field_validator(other))
+        self.assertIsNone(compile_field_validator(self.field2))
+        
+    def test_submit_form_rejects_duplicate_answers(self):
+        """Test a field answered twice is rejected"""
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
+        data = {
+            'session_id': self.session_id,
+            'answers': [
+                {'field_id': str(self.field1.id), 'text_value': 'John Doe'},
+                {'field_id': str(self.field1.id), 'text_value': 'Jane Doe'},
+                {'field_id': str(self.field2.id), 'text_value': 'john@example.com'},
+            ]
+        }
+        response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('only be answered once', str(response.data['answers']))
+        
     def test_submit_form_missing_required_fields(self):
         """Test submitting form without required fields"""
         url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
@@ -211,6 +476,21 @@ class PublicFormAPITestCase(APITestCase):
         response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Required fields missing: Email Address', str(response.data['answers']))
+        
+    def test_submit_form_reports_all_missing_required_fields(self):
+        """Test every missing required field is named in one error"""
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
+        data = {
+            'session_id': self.session_id,
+            'answers': [
+                {'field_id': str(self.field3.id), 'text_value': 'Great form!'}
+            ]
+        }
+        response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('Full Name, Email Address', str(response.data['answers']))
         
     def test_submit_form_private_without_password(self):
         """Test submitting private form without password verification"""
@@ -243,6 +523,24 @@ class PublicFormAPITestCase(APITestCase):
         self.assertEqual(submission.status, 'draft')
         self.assertIsNone(submission.submitted_at)
         
+    def test_save_draft_skips_answer_rules(self):
+        """Test drafts keep partial answers that break field rules"""
+        self.field1.validation_rules = {'min_length': 5}
+        self.field1.save()
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submissions/draft/'
+        data = {
+            'session_id': self.session_id,
+            'answers': [
+                {'field_id': str(self.field1.id), 'text_value': 'Jo'},
+                {'field_id': str(self.field2.id), 'text_value': ''},
+            ]
+        }
+        response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        submission = FormSubmission.objects.get(id=response.data['submission_id'])
+        self.assertEqual(submission.answers.count(), 2)
+        
     def test_get_draft_success(self):
         """Test getting draft submission"""
         submission = FormSubmission.objects.create(
@@ -257,15 +555,46 @@ class PublicFormAPITestCase(APITestCase):
         )
         
         url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submissions/draft/{self.session_id}/'
-        response = self.client.get(url)
+        # The draft joined with its form, then its answers
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'draft')
         self.assertEqual(len(response.data['answers']), 1)
         
+    def test_legacy_session_id_finds_migrated_draft(self):
+        """Test a pre-UUID session id a client still holds maps to its migrated draft"""
+        from shared.utils import legacy_session_uuid
+        
+        submission = FormSubmission.objects.create(
+            form=self.public_form,
+            session_id=legacy_session_uuid('legacy-client-session'),
+            status='draft'
+        )
+        
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submissions/draft/legacy-client-session/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], str(submission.id))
+        
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submit/'
+        response = self.client.post(url, {
+            'session_id': 'legacy-client-session',
+            'answers': [
+                {'field_id': str(self.field1.id), 'text_value': 'John Doe'},
+                {'field_id': str(self.field2.id), 'text_value': 'john@example.com'}
+            ]
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            FormSubmission.objects.get(id=response.data['submission_id']).session_id,
+            submission.session_id
+        )
+        
     def test_get_draft_not_found(self):
         """Test getting non-existent draft"""
-        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submissions/draft/non-existent-session/'
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submissions/draft/1f44d04a-edf1-53b2-ab14-f51f3c335d50/'
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -296,13 +625,48 @@ class PublicFormAPITestCase(APITestCase):
                 }
             ]
         }
-        response = self.client.patch(url, data, format='json')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        draft_lookup = next(q['sql'] for q in queries if 'FROM "form_submission"' in q['sql'])
+        self.assertIn('FOR UPDATE OF "form_submission"', draft_lookup)
         
         submission.refresh_from_db()
         self.assertEqual(submission.answers.count(), 2)
         self.assertEqual(submission.answers.get(field=self.field1).text_value, 'Jane Doe')
+        
+    def test_update_draft_writes_only_changed_answers(self):
+        """Test updating a draft keeps unchanged answer rows in place"""
+        submission = FormSubmission.objects.create(
+            form=self.public_form,
+            session_id=self.session_id,
+            status='draft'
+        )
+        kept = SubmissionAnswer.objects.create(
+            submission=submission, field=self.field1, text_value='John Doe'
+        )
+        changed = SubmissionAnswer.objects.create(
+            submission=submission, field=self.field2, text_value='john@example.com'
+        )
+        dropped = SubmissionAnswer.objects.create(
+            submission=submission, field=self.field3, text_value='Hello'
+        )
+        
+        url = f'/api/v1/public/forms/{self.public_form.unique_slug}/submissions/draft/{self.session_id}/'
+        data = {
+            'answers': [
+                {'field_id': str(self.field1.id), 'text_value': 'John Doe'},
+                {'field_id': str(self.field2.id), 'text_value': 'jane@example.com'},
+            ]
+        }
+        response = self.client.patch(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        answers = {answer.id: answer for answer in submission.answers.all()}
+        self.assertEqual(set(answers), {kept.id, changed.id})
+        self.assertEqual(answers[changed.id].text_value, 'jane@example.com')
+        self.assertFalse(SubmissionAnswer.objects.filter(id=dropped.id).exists())
 
 
 # ============================================================================
@@ -312,88 +676,104 @@ class PublicFormAPITestCase(APITestCase):
 class SubmissionManagementAPITestCase(APITestCase):
     """Test cases for Submission Management API endpoints"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.owner = User.objects.create_user(
-            email='owner@example.com',
-            first_name='Owner',
-            last_name='User',
-            password='testpass123'
-        )
-        
-        self.other_user = User.objects.create_user(
-            email='other@example.com',
-            first_name='Other',
-            last_name='User',
-            password='testpass123'
-        )
-        
-        self.form = Form.objects.create(
-            user=self.owner,
-            title='Test Form',
-            unique_slug='test-form',
-            visibility='public',
-            is_active=True
-        )
-        
-        self.other_form = Form.objects.create(
-            user=self.other_user,
-            title='Other Form',
-            unique_slug='other-form',
-            visibility='public',
-            is_active=True
-        )
-        
-        self.field1 = FormField.objects.create(
-            form=self.form,
-            field_type='text',
-            label='Name',
-            is_required=True,
-            order_index=0
-        )
-        
-        self.field2 = FormField.objects.create(
-            form=self.form,
-            field_type='email',
-            label='Email',
-            is_required=True,
-            order_index=1
-        )
-        
-        self.submission1 = FormSubmission.objects.create(
-            form=self.form,
-            user=self.owner,
-            session_id='session-1',
+        cls.owner, cls.other_user = User.objects.bulk_create([
+            User(
+                email='owner@example.com',
+                username='owner@example.com',
+                first_name='Owner',
+                last_name='User',
+                password=TEST_PASSWORD_HASH
+            ),
+            User(
+                email='other@example.com',
+                username='other@example.com',
+                first_name='Other',
+                last_name='User',
+                password=TEST_PASSWORD_HASH
+            ),
+        ])
+        
+        cls.form, cls.other_form = Form.objects.bulk_create([
+            Form(
+                user=cls.owner,
+                title='Test Form',
+                unique_slug='test-form',
+                visibility='public',
+                is_active=True
+            ),
+            Form(
+                user=cls.other_user,
+                title='Other Form',
+                unique_slug='other-form',
+                visibility='public',
+                is_active=True
+            ),
+        ])
+        
+        cls.field1, cls.field2 = FormField.objects.bulk_create([
+            FormField(
+                form=cls.form,
+                field_type='text',
+                label='Name',
+                is_required=True,
+                order_index=0
+            ),
+            FormField(
+                form=cls.form,
+                field_type='email',
+                label='Email',
+                is_required=True,
+                order_index=1
+            ),
+        ])
+        
+        # Submissions go through create() so signals keep form.submission_count
+        cls.submission1 = FormSubmission.objects.create(
+            form=cls.form,
+            user=cls.owner,
+            session_id='1b16e230-a9ef-5208-9328-2d21574f185d',
             status='submitted'
         )
         
-        self.submission2 = FormSubmission.objects.create(
-            form=self.form,
+        cls.submission2 = FormSubmission.objects.create(
+            form=cls.form,
             user=None,
-            session_id='session-2',
+            session_id='420a24e2-b634-5747-b3ec-6f9f6aac39b6',
             status='draft'
         )
         
-        SubmissionAnswer.objects.create(
-            submission=self.submission1,
-            field=self.field1,
-            text_value='John Doe'
-        )
-        
-        SubmissionAnswer.objects.create(
-            submission=self.submission1,
-            field=self.field2,
-            text_value='john@example.com'
-        )
+        SubmissionAnswer.objects.bulk_create([
+            SubmissionAnswer(
+                submission=cls.submission1,
+                field=cls.field1,
+                text_value='John Doe'
+            ),
+            SubmissionAnswer(
+                submission=cls.submission1,
+                field=cls.field2,
+                text_value='john@example.com'
+            ),
+        ])
+        
+        # Signed once per class; setUp attaches it to each test's client
+        # An access token alone skips the blacklist app's OutstandingToken write
+        cls.auth_header = f'Bearer {AccessToken.for_user(cls.owner)}'
         
-        refresh = RefreshToken.for_user(self.owner)
-        self.token = str(refresh.access_token)
-        self.auth_header = f'Bearer {self.token}'
+    def setUp(self):
+        # Fixtures are shared across the class, so cached statistics keyed
+        # by form id would otherwise leak from one test into the next
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION=self.auth_header)
         
     def test_list_submissions_success(self):
         """Test listing submissions"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        # user auth + form + page + answers; the total is form.submission_count
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 2)
@@ -402,22 +782,200 @@ class SubmissionManagementAPITestCase(APITestCase):
     def test_list_submissions_filter_by_status(self):
         """Test filtering submissions by status"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/?status=submitted'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
         self.assertEqual(response.data['results'][0]['status'], 'submitted')
         
+    def test_list_submissions_page_size(self):
+        """Test page_size query param splits results across pages"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/?page_size=1&page=2'
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['page'], 2)
+        self.assertEqual(response.data['total_pages'], 2)
+        self.assertEqual(len(response.data['results']), 1)
+        
+    def test_list_submissions_page_past_the_end_is_empty(self):
+        """Test a page beyond the last one returns 200 with no results"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        for params in ({'page': 5}, {'page': 5, 'status': 'submitted'}):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['page'], 5)
+                self.assertEqual(response.data['total_pages'], 1)
+                self.assertEqual(response.data['results'], [])
+        
+    def test_list_submissions_page_size_is_clamped(self):
+        """Test oversized page_size falls back to the 100 row maximum"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/?page_size=1000000'
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['page_size'], 100)
+        
+    def test_list_submissions_rejects_deep_offset(self):
+        """Test deep page numbers are refused before any submission query"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/?page=99999999&page_size=100'
+        
+        # user auth + form
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('cursor', response.data['error'])
+        
+    def test_list_submissions_keyset_cursor(self):
+        """Test cursor pagination walks back in time without a count"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        cursor = (timezone.now() + timedelta(minutes=1)).isoformat()
+        response = self.client.get(url, {'cursor': cursor, 'page_size': 1})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertEqual(response.json()['results'][0]['id'], str(self.submission2.id))
+        
+        response = self.client.get(url, {'cursor': response.data['next_cursor'], 'page_size': 1})
+        self.assertEqual(response.json()['results'][0]['id'], str(self.submission1.id))
+        
+    def test_list_submissions_keyset_cursor_same_timestamp(self):
+        """Test rows sharing created_at at a page boundary are all returned once"""
+        FormSubmission.objects.filter(form=self.form).update(created_at=timezone.now())
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        cursor = (timezone.now() + timedelta(minutes=1)).isoformat()
+        
+        seen = []
+        while cursor:
+            response = self.client.get(url, {'cursor': cursor, 'page_size': 1})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(row['id'] for row in response.json()['results'])
+            cursor = response.data['next_cursor']
+        
+        self.assertCountEqual(seen, [str(self.submission1.id), str(self.submission2.id)])
+        
+    def test_list_submissions_invalid_cursor(self):
+        """Test malformed cursor is rejected"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/?cursor=yesterday'
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+    def test_list_submissions_query_count(self):
+        """Test list query count does not grow with the number of rows"""
+        for _ in range(3):
+            FormSubmission.objects.create(form=self.form, user=self.owner, session_id=uuid.uuid4(), status='submitted')
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        
+        # user auth + form + page + answers prefetch; the total is form.submission_count
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(response.data['results'][-1]['form_title'], self.form.title)
+        
+    def test_list_submissions_empty_skips_page_query(self):
+        """Test an empty result stops after the count query"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        
+        # user auth + form + count
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'search': 'no-such-submission'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+        self.assertEqual(response.data['results'], [])
+        
+    def test_list_submissions_recounts_drifted_counter(self):
+        """Test a counter the page contradicts is replaced by COUNT(*)"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        for stale in (0, 3):
+            with self.subTest(stale=stale):
+                Form.objects.filter(pk=self.form.pk).update(submission_count=stale)
+                response = self.client.get(url)
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['count'], 2)
+                self.assertEqual(response.data['total_pages'], 1)
+                self.assertEqual(len(response.data['results']), 2)
+                self.form.refresh_from_db()
+                self.assertEqual(self.form.submission_count, 2)
+        
+    def test_duplicated_form_starts_without_submissions(self):
+        """Test a duplicated form does not inherit the original's counter"""
+        response = self.client.post(f'/api/v1/forms/{self.form.unique_slug}/duplicate/')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        
+        copy = Form.objects.get(unique_slug=response.data['unique_slug'])
+        self.assertEqual(copy.submission_count, 0)
+        response = self.client.get(f'/api/v1/forms/{copy.unique_slug}/submissions/')
+        self.assertEqual(response.data['count'], 0)
+        self.form.refresh_from_db()
+        self.assertEqual(self.form.submission_count, 2)
+        
+    def test_form_submission_count_follows_creates_and_deletes(self):
+        """Test the form's submission counter tracks created and deleted submissions"""
+        self.form.refresh_from_db()
+        self.assertEqual(self.form.submission_count, 2)
+        
+        base = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        self.client.delete(f'{base}{self.submission2.id}/')
+        self.form.refresh_from_db()
+        self.assertEqual(self.form.submission_count, 1)
+        
+        self.client.post(f'{base}bulk-delete/', {'submission_ids': [str(self.submission1.id)]}, format='json')
+        self.form.refresh_from_db()
+        self.assertEqual(self.form.submission_count, 0)
+        
+    def test_list_submissions_search(self):
+        """Test search matches user email and session id substrings"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        response = self.client.get(url, {'search': 'OWNER@'})
+        self.assertEqual([r['id'] for r in response.json()['results']], [str(self.submission1.id)])
+        
+        response = self.client.get(url, {'search': '420a24e2'})
+        self.assertEqual([r['id'] for r in response.json()['results']], [str(self.submission2.id)])
+        
+    def test_list_submissions_matches_serializer_output(self):
+        """Test the values()-based list renders exactly what the list serializer would"""
+        SubmissionAnswer.objects.create(
+            submission=self.submission2,
+            field=FormField.objects.create(form=self.form, field_type='number', label='Age', order_index=2),
+            numeric_value=Decimal('30.25')
+        )
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        response = self.client.get(url)
+        
+        submissions = FormSubmission.objects.filter(form=self.form).order_by('-created_at')
+        expected = json.loads(JSONRenderer().render(FormSubmissionListSerializer(submissions, many=True).data))
+        results = response.json()['results']
+        for row in results + expected:
+            row['answers'].sort(key=lambda answer: answer['id'])
+        self.assertEqual(results, expected)
+        
+    def test_list_submissions_omits_metadata(self):
+        """Test list results are summaries without the metadata blob"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('metadata', response.data['results'][0])
+        
     def test_list_submissions_not_owner(self):
         """Test listing submissions for form user doesn't own"""
         url = f'/api/v1/forms/{self.other_form.unique_slug}/submissions/'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
     def test_list_submissions_unauthenticated(self):
         """Test listing submissions without authentication"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/'
+        self.client.credentials()
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -425,23 +983,51 @@ class SubmissionManagementAPITestCase(APITestCase):
     def test_retrieve_submission_success(self):
         """Test retrieving single submission"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/{self.submission1.id}/'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        # user auth + form + submission with form/user + answers with fields
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['id'], str(self.submission1.id))
         self.assertEqual(len(response.data['answers']), 2)
         
+    def test_retrieve_submission_query_count_independent_of_answers(self):
+        """Test more answers do not add queries to retrieve"""
+        for index in range(2, 6):
+            field = FormField.objects.create(
+                form=self.form, field_type='text', label=f'Extra {index}', order_index=index
+            )
+            SubmissionAnswer.objects.create(submission=self.submission1, field=field, text_value='x')
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/{self.submission1.id}/'
+        
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        
+        self.assertEqual(len(response.data['answers']), 6)
+        self.assertEqual({a['field_type'] for a in response.data['answers']}, {'text', 'email'})
+        
+    def test_get_form_is_cached_per_view(self):
+        """Test get_form() hits the database once per view instance"""
+        request = APIRequestFactory().get('/')
+        request.user = self.owner
+        view = SubmissionManagementViewSet(request=request, kwargs={'slug': self.form.unique_slug})
+        
+        with self.assertNumQueries(1):
+            self.assertEqual(view.get_form(), self.form)
+            view.get_queryset()
+            view.get_form()
+        
     def test_retrieve_submission_not_found(self):
         """Test retrieving non-existent submission"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/{uuid.uuid4()}/'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
     def test_delete_submission_success(self):
         """Test deleting a submission"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/{self.submission2.id}/'
-        response = self.client.delete(url, HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(FormSubmission.objects.filter(id=self.submission2.id).exists())
@@ -449,14 +1035,16 @@ class SubmissionManagementAPITestCase(APITestCase):
     def test_delete_submission_not_owner(self):
         """Test deleting submission from form user doesn't own"""
         url = f'/api/v1/forms/{self.other_form.unique_slug}/submissions/{self.submission1.id}/'
-        response = self.client.delete(url, HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
     def test_statistics_success(self):
         """Test getting submission statistics"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/stats/'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        # user auth + form + cache version + one aggregate + submissions by date
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['total_submissions'], 2)
@@ -465,10 +1053,63 @@ class SubmissionManagementAPITestCase(APITestCase):
         self.assertEqual(response.data['unique_users'], 1)
         self.assertEqual(response.data['anonymous_count'], 1)
         
+    def test_statistics_average_completion_time(self):
+        """Test average completion time is computed in minutes"""
+        FormSubmission.objects.filter(id=self.submission1.id).update(
+            submitted_at=self.submission1.created_at + timedelta(minutes=10)
+        )
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/stats/'
+        response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertAlmostEqual(response.data['average_completion_time'], 10.0)
+        
+    def test_statistics_query_count(self):
+        """Test statistics use one aggregate plus the by-date grouping"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/stats/'
+        # user auth + form lookup + cache version + aggregate + submissions by date
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+    def test_statistics_cached_until_submissions_change(self):
+        """Test repeat stats requests are served from cache and by ETag"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/stats/'
+        first = self.client.get(url)
+        
+        # user auth + form lookup + cache version
+        with self.assertNumQueries(3):
+            cached = self.client.get(url)
+        self.assertEqual(cached.data, first.data)
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        FormSubmission.objects.filter(id=self.submission2.id).update(status='submitted')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['submitted_count'], 2)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        
+    def test_statistics_if_none_match_is_parsed(self):
+        """Test If-None-Match is parsed as an ETag list, not searched as text"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/stats/'
+        etag = self.client.get(url)['ETag']
+        
+        for header in (f'"other", {etag}', f'W/{etag}', '*'):
+            with self.subTest(header=header):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=header)
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        # Contains the tag's text but names a different ETag
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=f'"x{etag[1:]}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
     def test_statistics_not_owner(self):
         """Test getting statistics for form user doesn't own"""
         url = f'/api/v1/forms/{self.other_form.unique_slug}/submissions/stats/'
-        response = self.client.get(url, HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
@@ -476,7 +1117,7 @@ class SubmissionManagementAPITestCase(APITestCase):
         """Test bulk deleting submissions"""
         submission3 = FormSubmission.objects.create(
             form=self.form,
-            session_id='session-3',
+            session_id='9a99e817-ee56-52f5-9d8b-160c6fc417e4',
             status='submitted'
         )
         
@@ -484,18 +1125,33 @@ class SubmissionManagementAPITestCase(APITestCase):
         data = {
             'submission_ids': [str(self.submission1.id), str(submission3.id)]
         }
-        response = self.client.post(url, data, format='json', HTTP_AUTHORIZATION=self.auth_header)
+        # auth, form, id check, one DELETE per table and one counter UPDATE,
+        # however many submissions are deleted
+        with self.assertNumQueries(11):
+            response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreaterEqual(response.data['deleted_count'], 2)
-        self.assertFalse(FormSubmission.objects.filter(id=self.submission1.id).exists())
-        self.assertFalse(FormSubmission.objects.filter(id=submission3.id).exists())
+        self.assertEqual(response.data['deleted_count'], 2)
+        self.assertFalse(FormSubmission.objects.filter(id__in=[self.submission1.id, submission3.id]).exists())
+        self.assertFalse(SubmissionAnswer.objects.filter(submission_id=self.submission1.id).exists())
+        
+    def test_bulk_delete_reports_missing_ids(self):
+        """Test bulk delete names the ids that are not on this form"""
+        missing_id = '00000000-0000-0000-0000-000000000001'
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/bulk-delete/'
+        data = {'submission_ids': [str(self.submission1.id), missing_id]}
+        response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(missing_id, str(response.data['submission_ids'][0]))
+        self.assertNotIn(str(self.submission1.id), str(response.data['submission_ids'][0]))
+        self.assertTrue(FormSubmission.objects.filter(id=self.submission1.id).exists())
         
     def test_bulk_delete_empty_list(self):
         """Test bulk delete with empty list"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/bulk-delete/'
         data = {'submission_ids': []}
-        response = self.client.post(url, data, format='json', HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
@@ -506,12 +1162,96 @@ class SubmissionManagementAPITestCase(APITestCase):
             'format': 'csv',
             'status': 'submitted'
         }
-        response = self.client.post(url, data, format='json', HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
         self.assertEqual(response['Content-Type'], 'text/csv')
         self.assertIn('attachment', response['Content-Disposition'])
         
+        chunks = iter(response.streaming_content)
+        header = next(chunks).decode().strip()
+        self.assertEqual(header, 'Submission ID,User,Status,Submitted At,Name,Email')
+        lines = b''.join(chunks).decode().strip().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn('John Doe,john@example.com', lines[0])
+        
+    def test_export_csv_submission_columns(self):
+        """Test submission id, user and submitted_at text in CSV rows"""
+        submitted_at = timezone.now().replace(microsecond=123456)
+        FormSubmission.objects.filter(id=self.submission1.id).update(submitted_at=submitted_at)
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
+        data = {'format': 'csv', 'status': 'all', 'include_drafts': True}
+        response = self.client.post(url, data, format='json')
+        
+        rows = {line.split(',')[0]: line.split(',')[:4] for line in b''.join(response.streaming_content).decode().splitlines()[1:]}
+        self.assertEqual(
+            rows[str(self.submission1.id)],
+            [str(self.submission1.id), 'owner@example.com', 'submitted', submitted_at.isoformat()]
+        )
+        self.assertEqual(rows[str(self.submission2.id)][1:], ['Anonymous', 'draft', ''])
+        
+    def test_export_csv_query_count(self):
+        """Test CSV export reads answers in one query regardless of row count"""
+        for i in range(3):
+            extra = FormSubmission.objects.create(
+                form=self.form,
+                session_id=uuid.uuid4(),
+                status='submitted'
+            )
+            SubmissionAnswer.objects.create(submission=extra, field=self.field1, text_value=f'Extra {i}')
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
+        data = {'format': 'csv', 'status': 'submitted'}
+        
+        # user auth + form + fields + submission columns + answers
+        with self.assertNumQueries(5):
+            response = self.client.post(url, data, format='json')
+            lines = b''.join(response.streaming_content).decode().strip().splitlines()
+        
+        self.assertEqual(len(lines), 5)
+        
+    def test_export_csv_across_batches(self):
+        """Test streamed CSV export keeps every row when it spans several batches"""
+        extras = []
+        for i in range(4):
+            extra = FormSubmission.objects.create(
+                form=self.form,
+                session_id=uuid.uuid4(),
+                status='submitted'
+            )
+            SubmissionAnswer.objects.create(submission=extra, field=self.field1, text_value=f'Extra {i}')
+            extras.append(extra)
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
+        data = {'format': 'csv', 'status': 'submitted'}
+        
+        with mock.patch('submissions.owner_views.EXPORT_CHUNK_SIZE', 2):
+            response = self.client.post(url, data, format='json')
+            lines = b''.join(response.streaming_content).decode().strip().splitlines()
+        
+        rows = {line.split(',')[0]: line.split(',') for line in lines[1:]}
+        self.assertEqual(len(rows), 5)
+        for i, extra in enumerate(extras):
+            self.assertEqual(rows[str(extra.id)][4], f'Extra {i}')
+        
+    def test_export_streams_under_asgi(self):
+        """Test CSV and JSON exports are pulled chunk by chunk when consumed asynchronously"""
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
+        
+        async def consume(response):
+            return [chunk async for chunk in response]
+        
+        for export_format in ('csv', 'json'):
+            with self.subTest(format=export_format):
+                response = self.client.post(url, {'format': export_format, 'status': 'all', 'include_drafts': True}, format='json')
+                
+                # Django warns when it has to collect a sync iterator into a list
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error')
+                    chunks = async_to_sync(consume)(response)
+                
+                self.assertEqual(len(chunks), 3)
+                self.assertIn(b'John Doe', b''.join(chunks))
+        
     def test_export_json_success(self):
         """Test exporting submissions as JSON"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
@@ -519,11 +1259,51 @@ class SubmissionManagementAPITestCase(APITestCase):
             'format': 'json',
             'status': 'all'
         }
-        response = self.client.post(url, data, format='json', HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
         self.assertEqual(response['Content-Type'], 'application/json')
         
+        exported = {item['id']: item for item in json.loads(b''.join(response.streaming_content))}
+        self.assertEqual(
+            exported[str(self.submission1.id)]['answers'],
+            {'Name': 'John Doe', 'Email': 'john@example.com'}
+        )
+        self.assertEqual(exported[str(self.submission1.id)]['user'], 'owner@example.com')
+        
+    def test_export_json_empty(self):
+        """Test JSON export with no matching submissions is an empty array"""
+        FormSubmission.objects.filter(form=self.form).delete()
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
+        response = self.client.post(url, {'format': 'json', 'status': 'all'}, format='json')
+        
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [])
+        
+    def test_export_formats_each_answer_type(self):
+        """Test exported answer text for every value column"""
+        answered_at = timezone.now()
+        typed = [
+            ('number', {'numeric_value': Decimal('42.5')}, '42.500000'),
+            ('checkbox', {'boolean_value': False}, 'No'),
+            ('date', {'date_value': answered_at}, answered_at.isoformat()),
+            ('select', {'array_value': ['Red', 'Blue']}, 'Red, Blue'),
+            ('file', {'text_value': '', 'file_url': 'https://example.com/cv.pdf'}, 'https://example.com/cv.pdf'),
+        ]
+        for index, (field_type, values, _) in enumerate(typed):
+            field = FormField.objects.create(
+                form=self.form, field_type=field_type, label=field_type, order_index=index + 2
+            )
+            SubmissionAnswer.objects.create(submission=self.submission1, field=field, **values)
+        url = f'/api/v1/forms/{self.form.unique_slug}/submissions/export/'
+        data = {'format': 'json', 'status': 'submitted'}
+        response = self.client.post(url, data, format='json')
+        
+        answers = json.loads(b''.join(response.streaming_content))[0]['answers']
+        for field_type, _, expected in typed:
+            with self.subTest(field_type=field_type):
+                self.assertEqual(answers[field_type], expected)
+        
     def test_bulk_export_success(self):
         """Test bulk exporting specific submissions"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/bulk-export/'
@@ -531,7 +1311,7 @@ class SubmissionManagementAPITestCase(APITestCase):
             'submission_ids': [str(self.submission1.id)],
             'format': 'json'
         }
-        response = self.client.post(url, data, format='json', HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response['Content-Type'], 'application/json')
@@ -540,7 +1320,7 @@ class SubmissionManagementAPITestCase(APITestCase):
         """Test bulk export with empty list"""
         url = f'/api/v1/forms/{self.form.unique_slug}/submissions/bulk-export/'
         data = {'submission_ids': []}
-        response = self.client.post(url, data, format='json', HTTP_AUTHORIZATION=self.auth_header)
+        response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -1,15 +1,25 @@
+import hashlib
+from functools import partial
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import BrowsableAPIRenderer
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django.shortcuts import get_object_or_404
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response, quote_etag
 from django.utils import timezone
-from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+from submissions import realtime
 from submissions.models import FormSubmission
 from forms.models import Form
-from analytics.models import FormView  # Assuming you have this model
+from shared.converters import SessionIdConverter
+from shared.renderers import ORJSONRenderer
+from forms.services import get_active_form, public_form_cache_key, PUBLIC_FORM_CACHE_TIMEOUT
+from analytics import buffered_writer
+from analytics.models import FormView
 
 from .serializers import (
     FormPublicSerializer,
@@ -20,6 +30,14 @@ from .serializers import (
 )
 
 
+# Wrong passwords allowed per form and address within the window (seconds)
+FORM_PASSWORD_MAX_ATTEMPTS = 10
+FORM_PASSWORD_ATTEMPT_WINDOW = 300
+
+# Wrong passwords allowed per form from all addresses within the window
+FORM_PASSWORD_MAX_FORM_ATTEMPTS = 100
+
+
 @extend_schema_view(
     retrieve=extend_schema(
         tags=['Public Forms'],
@@ -49,10 +67,11 @@ class PublicFormViewSet(viewsets.GenericViewSet):
     lookup_field = 'unique_slug'
     lookup_url_kwarg = 'slug'
     serializer_class = FormPublicSerializer  # Default serializer for schema generation
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         """Get active forms only"""
-        return Form.objects.filter(is_active=True).prefetch_related('fields__options')
+        return Form.objects.filter(is_active=True)
 
     def retrieve(self, request, slug=None):
         """
@@ -62,7 +81,9 @@ class PublicFormViewSet(viewsets.GenericViewSet):
         Returns form fields and structure for display
         Private forms require password verification first
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
+        # Gate on the cached slug lookup; the full row is only read
+        # below when the structure has to be serialized again
+        form = get_active_form(slug)
 
         # Check if password protected
         if form.visibility == 'private':
@@ -75,8 +96,24 @@ class PublicFormViewSet(viewsets.GenericViewSet):
                     'requires_password': True
                 }, status=status.HTTP_403_FORBIDDEN)
 
-        serializer = FormPublicSerializer(form)
-        return Response(serializer.data)
+        # The structure only changes when the form is edited, and edits
+        # drop the cached copy (see forms.signals)
+        cache_key = public_form_cache_key(form.id)
+        cached = cache.get(cache_key)
+        if cached is None:
+            form = get_object_or_404(self.get_queryset(), pk=form.pk)
+            data = FormPublicSerializer(form).data
+            # Tagged by content: field and option edits leave
+            # form.updated_at alone but do change the payload
+            etag = quote_etag(hashlib.md5(ORJSONRenderer().render(data)).hexdigest())
+            cached = (data, etag)
+            cache.set(cache_key, cached, timeout=PUBLIC_FORM_CACHE_TIMEOUT)
+        data, etag = cached
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        return Response(data, headers={'ETag': etag})
 
     @extend_schema(
         tags=['Public Forms'],
@@ -86,7 +123,8 @@ class PublicFormViewSet(viewsets.GenericViewSet):
         responses={
             200: {'type': 'object', 'properties': {
                 'message': {'type': 'string', 'example': 'Password verified successfully'},
-                'access_granted': {'type': 'boolean', 'example': True}
+                'access_granted': {'type': 'boolean', 'example': True},
+                'already_verified': {'type': 'boolean', 'example': False}
             }},
             400: {'description': 'Form is not password protected'}
         }
@@ -99,27 +137,54 @@ class PublicFormViewSet(viewsets.GenericViewSet):
 
         Body: {"password": "secret"}
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
+        form = get_active_form(slug)
 
         if form.visibility != 'private':
             return Response({
                 'error': 'This form is not password protected'
             }, status=status.HTTP_400_BAD_REQUEST)
 
+        session_key = f'form_access_{form.id}'
+        if request.session.get(session_key):
+            # Access was granted earlier in this session; the submitted
+            # password is not checked, so don't claim it was verified
+            return Response({
+                'message': 'Access already granted for this session',
+                'access_granted': True,
+                'already_verified': True
+            })
+
+        # Refuse before hashing once an address, or the form as a whole,
+        # keeps getting wrong guesses. REMOTE_ADDR rather than the
+        # client-supplied X-Forwarded-For, which a guesser could rotate.
+        form_attempts_key = f'form_password_attempts:{form.id}'
+        attempts_key = f"{form_attempts_key}:{request.META.get('REMOTE_ADDR')}"
+        attempts = cache.get_many([attempts_key, form_attempts_key])
+        if (attempts.get(attempts_key, 0) >= FORM_PASSWORD_MAX_ATTEMPTS
+                or attempts.get(form_attempts_key, 0) >= FORM_PASSWORD_MAX_FORM_ATTEMPTS):
+            return Response({
+                'error': 'Too many failed attempts. Please try again later.'
+            }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+
         serializer = FormPasswordVerifySerializer(
             data=request.data,
             context={'form': form}
         )
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            for key in (attempts_key, form_attempts_key):
+                cache.add(key, 0, timeout=FORM_PASSWORD_ATTEMPT_WINDOW)
+                cache.incr(key)
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        cache.delete(attempts_key)
 
         # Store access in session
-        session_key = f'form_access_{form.id}'
         request.session[session_key] = True
         request.session.set_expiry(3600)  # 1 hour
 
         return Response({
             'message': 'Password verified successfully',
-            'access_granted': True
+            'access_granted': True,
+            'already_verified': False
         })
 
     @extend_schema(
@@ -144,7 +209,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             "metadata": {"user_agent": "...", "referer": "..."}
         }
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
+        form = get_active_form(slug)
 
         # Extract metadata
         session_id = request.data.get('session_id', request.session.session_key)
@@ -156,20 +221,13 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             'referer': request.META.get('HTTP_REFERER', ''),
         })
 
-        # Create view record
-        # NOTE: You need to create FormView model in analytics app
-        # Or skip this if you don't have analytics yet
-        try:
-            from analytics.models import FormView
-            FormView.objects.create(
-                form=form,
-                session_id=session_id or 'anonymous',
-                ip_address=request.META.get('REMOTE_ADDR'),
-                metadata=metadata
-            )
-        except ImportError:
-            # Analytics app not ready yet, skip
-            pass
+        # Written with the next batch of views rather than on this request
+        buffered_writer.enqueue(FormView(
+            form_id=form.id,
+            session_id=session_id or 'anonymous',
+            ip_address=request.META.get('REMOTE_ADDR'),
+            metadata=metadata
+        ))
 
         return Response({
             'message': 'View tracked successfully'
@@ -184,7 +242,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             201: {'type': 'object', 'properties': {
                 'message': {'type': 'string'},
                 'submission_id': {'type': 'string', 'format': 'uuid'},
-                'session_id': {'type': 'string'}
+                'session_id': {'type': 'string', 'format': 'uuid'}
             }},
             403: {'description': 'Password verification required for private forms'}
         }
@@ -206,7 +264,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             "metadata": {}
         }
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
+        form = get_active_form(slug)
 
         # Check password for private forms
         if form.visibility == 'private':
@@ -228,28 +286,18 @@ class PublicFormViewSet(viewsets.GenericViewSet):
         serializer.is_valid(raise_exception=True)
         submission = serializer.save()
 
-        try:
-            channel_layer = get_channel_layer()
-            group_name = f'form_report_{slug}'
-            
-            async_to_sync(channel_layer.group_send)(
-                group_name,
-                {
-                    "type": "report.update",
-                    "message": {
-                        "status": "new_submission_received",
-                        "submission_id": str(submission.id),
-                        "submitted_at": submission.submitted_at.isoformat()
-                    }
-                }
-            )
-        except Exception as e:
-            print(f"Error sending WebSocket signal: {e}") 
+        # Buffered and sent to the live report together with nearby
+        # submissions, once the submission is committed
+        transaction.on_commit(partial(realtime.enqueue, f'form_report_{slug}', {
+            "status": "new_submission_received",
+            "submission_id": str(submission.id),
+            "submitted_at": submission.submitted_at.isoformat()
+        }))
 
         return Response({
             'message': 'Form submitted successfully',
             'submission_id': submission.id,
-            'session_id': submission.session_id
+            'session_id': str(submission.session_id)
         }, status=status.HTTP_201_CREATED)
 
     @extend_schema(
@@ -261,7 +309,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             201: {'type': 'object', 'properties': {
                 'message': {'type': 'string'},
                 'submission_id': {'type': 'string', 'format': 'uuid'},
-                'session_id': {'type': 'string'}
+                'session_id': {'type': 'string', 'format': 'uuid'}
             }}
         }
     )
@@ -277,7 +325,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             "metadata": {}
         }
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
+        form = get_active_form(slug)
 
         # Prepare data
         data = request.data.copy()
@@ -294,7 +342,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
         return Response({
             'message': 'Draft saved successfully',
             'submission_id': submission.id,
-            'session_id': submission.session_id
+            'session_id': str(submission.session_id)
         }, status=status.HTTP_201_CREATED)
 
     @extend_schema(
@@ -306,21 +354,24 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             404: {'description': 'Draft not found'}
         }
     )
+    # Routed by the <session_id:...> path() in submissions/api/v1/urls.py;
+    # url_path only mirrors that pattern
     @action(
         detail=True,
         methods=['get'],
-        url_path='submissions/draft/(?P<session_id>[^/.]+)'
+        url_path=f'submissions/draft/(?P<session_id>{SessionIdConverter.regex})'
     )
     def get_draft(self, request, slug=None, session_id=None):
         """
         Get draft submission
         GET /api/v1/public/forms/{slug}/submissions/draft/{session_id}/
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
-
+        # The form is joined for the serializer anyway, so match it there
+        # instead of looking it up first
         submission = get_object_or_404(
-            FormSubmission,
-            form=form,
+            FormSubmissionReadSerializer.setup_eager_loading(FormSubmission.objects.all()),
+            form__unique_slug=slug,
+            form__is_active=True,
             session_id=session_id,
             status='draft'
         )
@@ -331,7 +382,7 @@ class PublicFormViewSet(viewsets.GenericViewSet):
     @action(
         detail=True,
         methods=['patch'],
-        url_path='submissions/draft/(?P<session_id>[^/.]+)'
+        url_path=f'submissions/draft/(?P<session_id>{SessionIdConverter.regex})'
     )
     def update_draft(self, request, slug=None, session_id=None):
         """
@@ -343,27 +394,29 @@ class PublicFormViewSet(viewsets.GenericViewSet):
             "metadata": {}
         }
         """
-        form = get_object_or_404(self.get_queryset(), unique_slug=slug)
-
-        submission = get_object_or_404(
-            FormSubmission,
-            form=form,
-            session_id=session_id,
-            status='draft'
-        )
-
         data = request.data.copy()
         data['form_slug'] = slug
         data['status'] = 'draft'
 
-        serializer = FormSubmissionSerializer(
-            submission,
-            data=data,
-            partial=True,
-            context={'request': request}
-        )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
+        # Hold the draft row until its answers are written, so concurrent
+        # PATCHes of one draft apply one after the other
+        with transaction.atomic():
+            submission = get_object_or_404(
+                FormSubmission.objects.select_for_update(of=('self',)),
+                form__unique_slug=slug,
+                form__is_active=True,
+                session_id=session_id,
+                status='draft'
+            )
+
+            serializer = FormSubmissionSerializer(
+                submission,
+                data=data,
+                partial=True,
+                context={'request': request}
+            )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
 
         return Response({
             'message': 'Draft updated successfully',